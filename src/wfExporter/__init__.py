@@ -14,69 +14,100 @@ Features:
 - Programmatic installation interface
 """
 
-# Main interface
+import importlib
+import importlib.util
+
+# Main interface. Bound eagerly (it is cheap) because importing the `.main`
+# submodule would otherwise shadow a lazily resolved `main` attribute.
 from .main import main
-from .core.databricks_exporter import DatabricksExporter
-from .cli_entry import cli_main
 
-# Individual modules for advanced usage
-from .logging import LogManager
-from .cli import DatabricksCliManager
-from .workflow import WorkflowExtractor
-from .processing import YamlSerializer, ExportFileHandler
-from .config import ConfigManager
+# Public names resolved on first access (PEP 562) so that importing the package,
+# or running `wf-export --help`, does not pull in the SDK and processing stack.
+_LAZY = {
+    # Main interface
+    'DatabricksExporter': ('.core.databricks_exporter', 'DatabricksExporter'),
+    'cli_main': ('.cli_entry', 'cli_main'),
 
-# Import installer classes for programmatic usage
-try:
-    from .installer import Installer, InstallerCore
-    _installer_available = True
-except ImportError:
-    # Gracefully handle missing installer dependencies
-    _installer_available = False
-    Installer = None
-    InstallerCore = None
+    # Individual modules for advanced usage
+    'LogManager': ('.logging', 'LogManager'),
+    'DatabricksCliManager': ('.cli', 'DatabricksCliManager'),
+    'WorkflowExtractor': ('.workflow', 'WorkflowExtractor'),
+    'YamlSerializer': ('.processing', 'YamlSerializer'),
+    'ExportFileHandler': ('.processing', 'ExportFileHandler'),
+    'ConfigManager': ('.config', 'ConfigManager'),
 
-# Version information - dynamically read from package metadata
-try:
-    from importlib.metadata import version
-    __version__ = version("wfexporter")
-except ImportError:
-    # Fallback for Python < 3.8
+    # Installer classes for programmatic usage (optional)
+    'Installer': ('.installer', 'Installer'),
+    'InstallerCore': ('.installer', 'InstallerCore'),
+}
+
+_OPTIONAL = ('Installer', 'InstallerCore')
+
+
+def __getattr__(name):
+    """Resolve lazily exported names on first access."""
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = spec
     try:
-        from importlib_metadata import version
-        __version__ = version("wfexporter")
+        value = getattr(importlib.import_module(module_name, __name__), attr)
     except ImportError:
-        # Final fallback if metadata is not available
-        __version__ = "unknown"
-except Exception:
-    # Fallback if package is not installed - read from pyproject.toml
+        if name not in _OPTIONAL:
+            raise
+        # Gracefully handle missing installer dependencies
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def _read_pyproject_version() -> str:
+    """Read the version from pyproject.toml when _version.py has not been generated."""
+    import os
+    import re
+
+    version_re = re.compile(rb'^version\s*=\s*["\']([^"\']+)["\']')
+
+    # Get the path to pyproject.toml (go up from src/wfExporter to project root)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    pyproject_path = os.path.join(os.path.dirname(os.path.dirname(current_dir)), "pyproject.toml")
+
     try:
-        import os
-        import re
-        
-        # Get the path to pyproject.toml (go up from src/wfExporter to project root)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        pyproject_path = os.path.join(project_root, "pyproject.toml")
-        
-        if os.path.exists(pyproject_path):
-            with open(pyproject_path, 'r') as f:
-                content = f.read()
-                # Use regex to find version = "x.y.z" in the [tool.poetry] section
-                version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if version_match:
-                    __version__ = version_match.group(1)
-                else:
-                    __version__ = "unknown"
-        else:
-            __version__ = "unknown"
-    except Exception:
-        __version__ = "unknown"
+        with open(pyproject_path, 'rb') as f:
+            # The first top-level `version = "x.y.z"` is the one in [tool.poetry]
+            for line in f:
+                match = version_re.match(line)
+                if match:
+                    return match.group(1).decode()
+    except OSError:
+        pass
+    return "unknown"
+
+
+def _installer_available() -> bool:
+    """Check whether the installer dependencies are importable, without importing them."""
+    try:
+        return importlib.util.find_spec('databricks.sdk') is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Version information - written at build time from pyproject.toml
+try:
+    from ._version import __version__
+except ImportError:
+    __version__ = _read_pyproject_version()
 
 __author__ = "Shubham Jain"
 
-# Public API
-__all__ = [
+# Public API (installer classes only when their dependencies are present)
+__all__ = (
     # Main interface
     'main',
     'cli_main',
@@ -92,8 +123,4 @@ __all__ = [
     
     # Metadata
     '__version__',
-]
-
-# Add installer classes if available
-if _installer_available:
-    __all__.extend(['Installer', 'InstallerCore'])
+) + (_OPTIONAL if _installer_available() else ())
@@ -0,0 +1,23 @@
+"""
+Console script entry point for wf-export.
+
+Version queries are answered here, before Click and the CLI modules are
+imported; everything else is handed to cli_entry.cli_main.
+"""
+
+import sys
+
+
+def main():
+    """Run the wf-export command line."""
+    if len(sys.argv) == 2 and sys.argv[1] in ('--version', '-v'):
+        from . import __version__
+        print(f"wf-export, version {__version__}")
+        sys.exit(0)
+
+    from .cli_entry import cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+# Package version, regenerated from pyproject.toml by the release build.
+__version__ = "0.4.2"
@@ -4,10 +4,140 @@ App CLI module for WF Exporter.
 This module handles running the Flask web application locally.
 """
 
-import click
 import os
 import sys
-from pathlib import Path
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def _wfexporter_dist():
+    """
+    Return the installed wfexporter distribution, memoized for the process lifetime.
+    
+    Returns:
+        The importlib.metadata Distribution, or None if the package is not installed
+    """
+    from importlib.metadata import distribution, PackageNotFoundError
+    try:
+        return distribution('wfexporter')
+    except PackageNotFoundError:
+        return None
+
+
+def _wf_app_candidates() -> Iterator['Path']:
+    """
+    Yield the candidate wf_app directories lazily, in lookup order.
+    
+    Yields:
+        Paths that may contain the wf_app package
+    """
+    from pathlib import Path
+    
+    # 1. The wf_app package as resolved by the import system (without executing it)
+    from importlib.util import find_spec
+    spec = find_spec('wf_app')
+    if spec is not None and spec.origin:
+        yield Path(spec.origin).parent
+    
+    # 2. Next to the installed wfexporter distribution
+    dist = _wfexporter_dist()
+    if dist is not None:
+        yield Path(dist.locate_file('')) / "wf_app"
+    
+    # 3. Relative to current working directory (development mode)
+    yield Path.cwd() / "wf_app"
+    
+    # 4. Project root of a source checkout (src/wfExporter/cli -> project root)
+    yield Path(__file__).resolve().parents[3] / "wf_app"
+
+
+@lru_cache(maxsize=1)
+def _find_wf_app_dir() -> Optional['Path']:
+    """
+    Find the first wf_app directory that contains a main.py.
+    
+    Returns:
+        Path to the wf_app directory, or None if it cannot be found
+    """
+    return next((path for path in _wf_app_candidates() if (path / "main.py").is_file()), None)
+
+
+def _load_wf_app_main(wf_app_dir: 'Path'):
+    """
+    Import wf_app from wf_app_dir as a package and return its main() function.
+    
+    The package is registered in sys.modules under its own name, so the relative
+    imports in wf_app/main.py resolve without adding anything to sys.path.
+    
+    Args:
+        wf_app_dir: Directory containing the wf_app package
+        
+    Returns:
+        The wf_app.main.main function
+    """
+    import importlib
+    from importlib.util import spec_from_file_location, module_from_spec
+    
+    if 'wf_app' not in sys.modules:
+        spec = spec_from_file_location('wf_app', wf_app_dir / "__init__.py",
+                                       submodule_search_locations=[str(wf_app_dir)])
+        package = module_from_spec(spec)
+        sys.modules['wf_app'] = package
+        try:
+            spec.loader.exec_module(package)
+        except BaseException:
+            # Do not leave a half-initialised package behind
+            sys.modules.pop('wf_app', None)
+            raise
+    return importlib.import_module('wf_app.main').main
+
+
+def _set_flask_env(host: str, port: int, debug: bool) -> None:
+    """
+    Export the Flask settings read by wf_app's main().
+    
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        debug: Enable debug mode
+    """
+    os.environ.update({
+        'FLASK_ENV': 'development' if debug else 'production',
+        'FLASK_HOST': host,
+        'FLASK_PORT': str(port),
+    })
+
+
+def _echo_server_banner(host: str, port: int, debug: bool, source: str, interactive: bool) -> None:
+    """
+    Print the server startup banner.
+    
+    When stdout is not a terminal (CI, supervisors, piped logs) only a single
+    plain line is written.
+    
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        debug: Enable debug mode
+        source: Line describing where wf_app was loaded from
+        interactive: Whether stdout is a terminal
+    """
+    import click
+    
+    if not interactive:
+        click.echo(f"Starting server on http://{host}:{port}")
+        return
+    
+    click.echo(f"🚀 Starting server on http://{host}:{port}")
+    click.echo(source)
+    if debug:
+        click.echo("🐛 Debug mode enabled")
+    click.echo("Press Ctrl+C to stop the server")
+    click.echo("")
 
 
 def run_local_app(host: str = '127.0.0.1', port: int = 5000, debug: bool = False) -> None:
@@ -19,27 +149,23 @@ def run_local_app(host: str = '127.0.0.1', port: int = 5000, debug: bool = False
         port: Port to bind to
         debug: Enable debug mode
     """
-    click.echo("🌐 Starting WF Exporter Web Application")
-    click.echo("=" * 40)
+    # Imported here so importing this module stays free until the app is run
+    import click
+
+    interactive = sys.stdout.isatty()
+    if interactive:
+        click.echo("🌐 Starting WF Exporter Web Application")
+        click.echo("=" * 40)
     
     # First, try to import wf_app directly and run it
     try:
-        # Set environment variables before importing
-        os.environ['FLASK_ENV'] = 'development' if debug else 'production'
-        os.environ['FLASK_HOST'] = host
-        os.environ['FLASK_PORT'] = str(port)
-        
         # Try to import and run wf_app directly
         import wf_app
         
-        click.echo(f"🚀 Starting server on http://{host}:{port}")
-        click.echo(f"📦 Using installed wf_app package: {wf_app.__file__}")
-        if debug:
-            click.echo("🐛 Debug mode enabled")
-        click.echo("Press Ctrl+C to stop the server")
-        click.echo("")
+        _echo_server_banner(host, port, debug, f"📦 Using installed wf_app package: {wf_app.__file__}", interactive)
         
         # Run the Flask app using the imported module
+        _set_flask_env(host, port, debug)
         wf_app.main()
         return
         
@@ -48,75 +174,24 @@ def run_local_app(host: str = '127.0.0.1', port: int = 5000, debug: bool = False
         click.echo("📁 Falling back to directory-based approach...")
         click.echo("")
     
-    # Fallback: Try multiple possible locations for wf_app directory
-    possible_paths = []
-    
-    # 1. Try to find wf_app by importing it and getting its path
-    try:
-        import wf_app
-        if hasattr(wf_app, '__file__') and wf_app.__file__:
-            wf_app_path = Path(wf_app.__file__).parent
-            possible_paths.append(wf_app_path)
-    except ImportError:
-        pass
-    
-    # 2. Try using pkg_resources to find the installed wf_app package
-    try:
-        import pkg_resources
-        dist = pkg_resources.get_distribution('wfexporter')
-        site_packages = Path(dist.location)
-        possible_paths.append(site_packages / "wf_app")
-    except (ImportError, pkg_resources.DistributionNotFound, FileNotFoundError):
-        pass
-    
-    # 3. Try using importlib.resources (Python 3.9+)
-    try:
-        try:
-            from importlib.resources import files
-        except ImportError:
-            from importlib_resources import files
-        
-        try:
-            wf_app_ref = files('wf_app')
-            if hasattr(wf_app_ref, '__fspath__'):
-                possible_paths.append(Path(wf_app_ref.__fspath__()))
-        except (ModuleNotFoundError, AttributeError):
-            pass
-    except ImportError:
-        pass
-    
-    # 4. Try relative to current working directory (development mode)
-    possible_paths.append(Path.cwd() / "wf_app")
-    
-    # 5. Try relative to this file's location (development structure)
-    current_dir = Path(__file__).parent.parent.parent.parent
-    possible_paths.append(current_dir / "wf_app")
-    
-    # 6. Try in the same directory as the package root (development)
-    wf_exporter_dir = Path(__file__).parent.parent.parent
-    possible_paths.append(wf_exporter_dir.parent / "wf_app")
-    
-    # Find the first existing wf_app directory
-    wf_app_dir = None
-    for path in possible_paths:
-        if path.exists() and path.is_dir() and (path / "main.py").exists():
-            wf_app_dir = path
-            break
+    # Fallback: locate the wf_app directory and run its main.py
+    wf_app_dir = _find_wf_app_dir()
     
     if not wf_app_dir:
         click.echo("❌ Error: wf_app directory not found in any of the following locations:")
-        for i, path in enumerate(possible_paths, 1):
+        for i, path in enumerate(_wf_app_candidates(), 1):
             click.echo(f"  {i}. {path}")
         click.echo("")
         click.echo("🔍 Debugging information:")
         
-        # Try to import wf_app and show what happens
-        try:
-            import wf_app
-            click.echo(f"✅ wf_app module found at: {wf_app.__file__}")
+        # Locate the wf_app module spec without executing the package
+        from importlib.util import find_spec
+        spec = find_spec('wf_app')
+        if spec is not None:
+            click.echo(f"✅ wf_app module found at: {spec.origin}")
             click.echo("ℹ️  The package is installed but may have an issue with the directory structure.")
-        except ImportError as e:
-            click.echo(f"❌ wf_app module not found: {e}")
+        else:
+            click.echo("❌ wf_app module not found")
             click.echo("ℹ️  The wf_app package may not be properly installed.")
         
         click.echo("")
@@ -125,26 +200,13 @@ def run_local_app(host: str = '127.0.0.1', port: int = 5000, debug: bool = False
         click.echo("   • Or run from project root directory")
         sys.exit(1)
     
-    # Add wf_app directory to Python path
-    sys.path.insert(0, str(wf_app_dir))
-    
-    # Set environment variables
-    os.environ['FLASK_ENV'] = 'development' if debug else 'production'
-    os.environ['FLASK_HOST'] = host
-    os.environ['FLASK_PORT'] = str(port)
-    
     try:
-        # Import and run the Flask app
-        from main import main as flask_main
+        flask_main = _load_wf_app_main(wf_app_dir)
         
-        click.echo(f"🚀 Starting server on http://{host}:{port}")
-        click.echo(f"📂 Using wf_app directory: {wf_app_dir}")
-        if debug:
-            click.echo("🐛 Debug mode enabled")
-        click.echo("Press Ctrl+C to stop the server")
-        click.echo("")
+        _echo_server_banner(host, port, debug, f"📂 Using wf_app directory: {wf_app_dir}", interactive)
         
         # Run the Flask app
+        _set_flask_env(host, port, debug)
         flask_main()
         
     except ImportError as e:
@@ -0,0 +1,34 @@
+"""
+`wf-export app` command group.
+
+This module defines the commands for working with the WF Exporter web application.
+"""
+
+import sys
+
+import click
+
+
+@click.group(name="app")
+def app_group():
+    """App-related commands."""
+    pass
+
+
+@app_group.command(name="run")
+@click.option('--host', default='127.0.0.1', help='Host to bind to')
+@click.option('--port', default=5000, help='Port to bind to')
+@click.option('--debug/--no-debug', default=False, help='Enable debug mode')
+def app_run(host, port, debug):
+    """Run the WF Exporter web application locally."""
+    # Import here to avoid loading Flask unless needed
+    from .app_cli import run_local_app
+    
+    try:
+        run_local_app(host=host, port=port, debug=debug)
+    except KeyboardInterrupt:
+        click.echo("\nApp stopped by user.")
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Failed to start app: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,60 @@
+"""
+Shared error handling for WF Exporter export commands.
+
+This module provides the decorator that turns export failures into
+user-facing messages and a non-zero exit code.
+"""
+
+import functools
+import sys
+
+import click
+
+# Shown when an export fails because Databricks authentication could not be set up
+_AUTH_HELP_LINES = (
+    "\nAuthentication Options:",
+    "1. Use config profile: Set 'v_databricks_config_profile' in config.yml",
+    "2. Environment variables: Set DATABRICKS_HOST and DATABRICKS_TOKEN",
+    "3. Command line: Use --host and --token arguments",
+    "4. Run in Databricks notebook (auto-authenticated)",
+)
+
+
+def _print_auth_or_generic(error: RuntimeError) -> None:
+    """
+    Report a RuntimeError, adding authentication guidance when relevant.
+    
+    Args:
+        error: The error raised by the export process
+    """
+    if "authentication" in str(error).lower():
+        click.echo("Error: Databricks authentication failed.", err=True)
+        click.echo("\n".join(_AUTH_HELP_LINES))
+    else:
+        click.echo(f"Error: {error}", err=True)
+
+
+def _handle_cli_errors(fn):
+    """
+    Exit with status 1 and a readable message when an export command fails.
+    
+    Args:
+        fn: Command callback to wrap
+        
+    Returns:
+        The wrapped callback
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except KeyboardInterrupt:
+            click.echo("\nOperation cancelled by user.")
+            sys.exit(1)
+        except RuntimeError as e:
+            _print_auth_or_generic(e)
+            sys.exit(1)
+        except Exception as e:
+            click.echo(f"Unexpected error: {e}", err=True)
+            sys.exit(1)
+    return wrapper
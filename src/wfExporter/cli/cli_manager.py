@@ -7,11 +7,36 @@ authentication, and command execution for both local and Databricks environments
 
 import os
 import re
+import shutil
+import sys
+import logging
 import subprocess
-from typing import Optional, Tuple, Union, List
+from typing import Dict, Iterator, Optional, Tuple, Union, List
 
 from ..logging.log_manager import LogManager
 
+# Official installer for the Databricks CLI (used in Databricks environments)
+_CLI_INSTALL_URL = "https://raw.githubusercontent.com/databricks/setup-cli/main/install.sh"
+
+# Seconds allowed for downloading and running the installer
+_CLI_DOWNLOAD_TIMEOUT = 30
+_CLI_INSTALL_TIMEOUT = 300
+
+# Where the official installer places the CLI; preferred over other 'databricks' binaries on PATH
+_CLI_DEFAULT_INSTALL_PATH = "/usr/local/bin/databricks"
+
+# Marks the end of each step's output in the fused bootstrap script
+_STEP_SENTINEL = "__WFX_STEP_DONE__"
+
+# Generated file paths reported by 'bundle generate job'
+_GENERATED_FILE_RE = re.compile(r'(src|resources)/[^\n\r]+')
+
+# Pipe buffer for 'bundle generate job', which lists every generated file on stderr
+_STDERR_BUFFER_SIZE = 1024 * 1024
+
+# Extensions of the files produced by 'bundle generate pipeline'
+_GENERATED_FILE_EXTENSIONS = frozenset({'.yml', '.yaml', '.py', '.sql', '.json'})
+
 
 class DatabricksCliManager:
     """
@@ -24,6 +49,9 @@ class DatabricksCliManager:
     - CLI command execution
     """
     
+    _environment_type: Optional[str] = None  # Detected once per process
+    _installer_script: Optional[str] = None  # Downloaded once per process
+    
     def __init__(self, cli_path: str = None, config_profile: str = None, logger: Optional[LogManager] = None):
         """
         Initialize the Databricks CLI Manager.
@@ -37,12 +65,68 @@ class DatabricksCliManager:
         self.config_profile = config_profile
         self.is_installed = False
         self.is_authenticated = False
+        # Step that made ensure_ready() fail: 'install', 'verify', 'auth_setup' or 'auth_test'
+        self.failed_step: Optional[str] = None
+        # (realpath of databricks_yml_path, realpath of start_path) -> (st_ino, st_mtime_ns, st_size) of the staged source
+        self._staged_yml: Dict[Tuple[str, str], Tuple[int, int, int]] = {}
         self.environment_type = self._detect_environment()
         self.logger = logger or LogManager()
         
         self.logger.debug(f"Detected environment: {self.environment_type}")
         self.logger.debug(f"CLI path: {self.cli_path}, Config profile: {self.config_profile}")
     
+    def _run(self, command: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """
+        Run a CLI command, capturing stdout only when debug logging will use it.
+        
+        stderr is always captured since it carries error details and, for
+        'bundle generate', the list of generated files.
+        
+        Args:
+            command: Command and arguments to execute
+            **kwargs: Extra keyword arguments for subprocess.run (cwd, timeout, ...)
+            
+        Returns:
+            subprocess.CompletedProcess: Result with stdout set to '' when discarded
+        """
+        capture_stdout = self.logger.isEnabledFor(logging.DEBUG)
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            **kwargs
+        )
+        if result.stdout is None:
+            result.stdout = ''
+        return result
+    
+    def _run_stderr_only(self, command: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+        """
+        Run a CLI command whose only useful output is on stderr.
+        
+        stdout is discarded so stderr can be drained with a single large read
+        straight from the pipe, without subprocess.run's reader machinery; the
+        bytes are decoded once at the end.
+        
+        Args:
+            command: Command and arguments to execute
+            cwd: Working directory for the command
+            
+        Returns:
+            subprocess.CompletedProcess: Result with empty stdout and decoded stderr
+        """
+        with subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=_STDERR_BUFFER_SIZE
+        ) as proc:
+            stderr = proc.stderr.read()
+            returncode = proc.wait()
+        return subprocess.CompletedProcess(command, returncode, '', stderr.decode(errors='replace'))
+    
     def _detect_environment(self) -> str:
         """
         Detect if running in Databricks environment or local environment.
@@ -50,22 +134,37 @@ class DatabricksCliManager:
         Returns:
             str: 'databricks' if running in Databricks, 'local' otherwise
         """
+        cls = type(self)
+        if cls._environment_type is None:
+            # Databricks Runtime sets this for notebooks and jobs; checking it avoids
+            # importing pyspark or touching a Spark session.
+            if os.environ.get("DATABRICKS_RUNTIME_VERSION") or cls._has_databricks_spark_session():
+                cls._environment_type = 'databricks'
+            else:
+                cls._environment_type = 'local'
+        return cls._environment_type
+    
+    @staticmethod
+    def _has_databricks_spark_session() -> bool:
+        """
+        Fallback detection through an already running Databricks Spark session.
+        
+        pyspark is never imported here, and the session is read from the
+        SparkSession class attribute rather than getActiveSession(), so nothing
+        happens unless a session already exists.
+        
+        Returns:
+            bool: True if an existing Spark session reports a Databricks workspace URL
+        """
+        pyspark = sys.modules.get('pyspark')
+        session_cls = getattr(getattr(pyspark, 'sql', None), 'SparkSession', None)
+        spark = getattr(session_cls, '_instantiatedSession', None)
+        if spark is None:
+            return False
         try:
-            # Check for Databricks-specific modules and variables
-            import sys
-            if 'databricks' in sys.modules or 'pyspark' in sys.modules:
-                # Try to access Databricks-specific utilities
-                try:
-                    import pyspark
-                    spark = pyspark.sql.SparkSession.getActiveSession()
-                    if spark and hasattr(spark, 'conf'):
-                        spark.conf.get('spark.databricks.workspaceUrl')
-                        return 'databricks'
-                except:
-                    pass
-            return 'local'
-        except:
-            return 'local'
+            return bool(spark.conf.get('spark.databricks.workspaceUrl', None))
+        except Exception:
+            return False
     
     def install_cli(self) -> bool:
         """
@@ -91,23 +190,23 @@ class DatabricksCliManager:
             self.cli_path = self.cli_path or "databricks"
             
             # Verify CLI is available
-            result = subprocess.run(
-                f"{self.cli_path} --version",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
+            result = self._run([self.cli_path, "--version"])
             
             if result.returncode == 0:
                 self.is_installed = True
                 self.logger.debug(f"Using local Databricks CLI at: {self.cli_path}")
-                self.logger.debug(f"CLI version: {result.stdout.strip()}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"CLI version: {result.stdout.strip()}")
                 return True
             else:
                 self.logger.error(f"Databricks CLI not found at: {self.cli_path}")
                 self.logger.error("Please install Databricks CLI: https://docs.databricks.com/dev-tools/cli/databricks-cli.html")
                 return False
                 
+        except FileNotFoundError:
+            self.logger.error(f"Databricks CLI not found at: {self.cli_path}")
+            self.logger.error("Please install Databricks CLI: https://docs.databricks.com/dev-tools/cli/databricks-cli.html")
+            return False
         except Exception as e:
             self.logger.error(f"Error setting up local CLI: {str(e)}")
             return False
@@ -120,31 +219,22 @@ class DatabricksCliManager:
             bool: True if installation successful, False otherwise
         """
         try:
-            command = "curl -fsSL https://raw.githubusercontent.com/databricks/setup-cli/main/install.sh | sh"
-            self.logger.debug(f"Installing Databricks CLI with command: {command}")
+            script = self._get_installer_script()
+            self.logger.debug(f"Installing Databricks CLI with installer from: {_CLI_INSTALL_URL}")
             
             result = subprocess.run(
-                command,
-                shell=True,
+                ["sh", "-s"],
+                input=script,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=_CLI_INSTALL_TIMEOUT,
+                check=False
             )
             self.logger.debug(result.stdout)
             
-            shell_output = result.stdout
-            
-            # Match1 works when CLI is installed first time
-            match1 = re.search(r"(/[\w\-./]+)(?=\.)", shell_output)
-            
-            # Match2 works when CLI is already installed
-            match2 = re.search(r"'([^']+)'", shell_output)
-            
-            if match1:
-                self.cli_path = match1.group(1)
-                self.is_installed = True
-                self.logger.debug(f"Databricks CLI installed to path: {self.cli_path}")
-            elif match2:
-                self.cli_path = match2.group(1)
+            cli_path = self._parse_install_path(result.stdout)
+            if cli_path:
+                self.cli_path = cli_path
                 self.is_installed = True
                 self.logger.debug(f"Databricks CLI installed to path: {self.cli_path}")
             else:
@@ -152,11 +242,64 @@ class DatabricksCliManager:
                 self.is_installed = False
             
             return self.is_installed
+        except subprocess.TimeoutExpired:
+            self.logger.error("Databricks CLI installation timed out")
+            self.is_installed = False
+            return False
         except Exception as e:
             self.logger.error(f"Error installing Databricks CLI: {str(e)}")
             self.is_installed = False
             return False
     
+    @classmethod
+    def _get_installer_script(cls) -> str:
+        """
+        Download the Databricks CLI install script, reusing it on later calls.
+        
+        Returns:
+            str: Contents of the install script
+        """
+        if cls._installer_script is None:
+            from urllib.request import urlopen
+            with urlopen(_CLI_INSTALL_URL, timeout=_CLI_DOWNLOAD_TIMEOUT) as response:
+                cls._installer_script = response.read().decode('utf-8')
+        return cls._installer_script
+    
+    @staticmethod
+    def _parse_install_path(shell_output: str) -> Optional[str]:
+        """
+        Extract the CLI path from the installer output.
+        
+        Args:
+            shell_output: Standard output of the install script
+            
+        Returns:
+            str: Path to the installed CLI, or None if it could not be determined
+        """
+        # Match1 works when CLI is installed first time: the longest
+        # "/path/chars" run that is followed by a '.' (e.g. "... at /usr/local/bin/databricks.")
+        start = shell_output.find('/')
+        while start != -1:
+            end = start + 1
+            while end < len(shell_output) and (shell_output[end].isalnum() or shell_output[end] in '_-./'):
+                end += 1
+            last_dot = shell_output.rfind('.', start + 2, end)
+            if last_dot != -1:
+                return shell_output[start:last_dot]
+            start = shell_output.find('/', start + 1)
+        
+        # Match2 works when CLI is already installed: the first non-empty 'quoted' value
+        start = shell_output.find("'")
+        while start != -1:
+            end = shell_output.find("'", start + 1)
+            if end == -1:
+                break
+            if end > start + 1:
+                return shell_output[start + 1:end]
+            start = end
+        
+        return None
+    
     def verify_installation(self) -> bool:
         """
         Verify that Databricks CLI is properly installed and functional.
@@ -171,15 +314,11 @@ class DatabricksCliManager:
                 return False
             
             # Test basic CLI functionality with version command
-            result = subprocess.run(
-                [self.cli_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._run([self.cli_path, "--version"], timeout=30)
             
             if result.returncode == 0:
-                self.logger.debug(f"CLI verification successful: {result.stdout.strip()}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"CLI verification successful: {result.stdout.strip()}")
                 return True
             else:
                 self.logger.error(f"CLI verification failed: {result.stderr}")
@@ -239,10 +378,12 @@ class DatabricksCliManager:
                 self.logger.debug("Using existing DATABRICKS_HOST and DATABRICKS_TOKEN environment variables")
                 return True
             else:
-                self.logger.error("Authentication required. Either:")
-                self.logger.error("1. Set config_profile parameter to use profile-based auth, or")
-                self.logger.error("2. Provide databricks_host and databricks_token parameters, or")
-                self.logger.error("3. Set DATABRICKS_HOST and DATABRICKS_TOKEN environment variables")
+                self.logger.error(
+                    "Authentication required. Either:\n"
+                    "1. Set config_profile parameter to use profile-based auth, or\n"
+                    "2. Provide databricks_host and databricks_token parameters, or\n"
+                    "3. Set DATABRICKS_HOST and DATABRICKS_TOKEN environment variables"
+                )
                 return False
                 
         except Exception as e:
@@ -314,15 +455,11 @@ class DatabricksCliManager:
             return False
             
         try:
-            result = subprocess.run(
-                f"{self.cli_path} current-user me",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
+            result = self._run([self.cli_path, "current-user", "me"])
             
             if result.returncode == 0:
-                self.logger.debug(f"Authentication test successful: {result.stdout.strip()}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Authentication test successful: {result.stdout.strip()}")
                 self.logger.debug("Authentication test successful")
                 self.is_authenticated = True
                 return True
@@ -336,6 +473,221 @@ class DatabricksCliManager:
             self.is_authenticated = False
             return False
 
+    def ensure_ready(self, databricks_host: str = None, databricks_token: str = None) -> bool:
+        """
+        Install or locate, verify and authenticate the CLI with as few subprocesses as possible.
+        
+        Locally the ``--version`` call made while locating the CLI doubles as the
+        installation check. In Databricks environments installation, the version
+        check and ``current-user me`` run as a single shell script. The script
+        resolves the binary itself, since a legacy ``databricks`` shim may come
+        first on PATH; if it resolves to something other than the path reported by
+        the installer, the reported path is verified and tested separately.
+        
+        On failure, ``failed_step`` names the step that failed.
+        
+        Args:
+            databricks_host: Databricks workspace URL (optional)
+            databricks_token: Databricks access token (optional)
+            
+        Returns:
+            bool: True if the CLI is installed and authenticated, False otherwise
+        """
+        self.failed_step = None
+        if self.environment_type == 'local':
+            if not self._setup_local_cli():
+                self.failed_step = 'install'
+            elif not self.setup_authentication(databricks_host, databricks_token):
+                self.failed_step = 'auth_setup'
+            elif not self.test_authentication():
+                self.failed_step = 'auth_test'
+            return self.failed_step is None
+        
+        # Credentials must be in the environment before the script calls the CLI
+        if not self.setup_authentication(databricks_host, databricks_token):
+            self.failed_step = 'auth_setup'
+            return False
+        
+        # The installer is fed to 'sh -s' on stdin; the later steps do not read stdin
+        # step_done marks the end of a step on stdout and stderr, each on its own line
+        # even when the step's output has no trailing newline
+        script = (
+            f'step_done() {{ s=$?; printf \'\\n%s %d\\n\' {_STEP_SENTINEL} "$s"; '
+            f'printf \'\\n%s %d\\n\' {_STEP_SENTINEL} "$s" >&2; }}\n'
+            'sh -s; step_done\n'
+            f'P=$(command -v {_CLI_DEFAULT_INSTALL_PATH} || command -v databricks); echo "$P"; step_done\n'
+            '"$P" --version; step_done\n'
+            '"$P" current-user me; step_done\n'
+        )
+        try:
+            result = subprocess.run(
+                ["bash", "-c", script],
+                input=self._get_installer_script(),
+                capture_output=True,
+                text=True,
+                timeout=_CLI_INSTALL_TIMEOUT,
+                check=False
+            )
+        except Exception as e:
+            self.logger.error(f"Error bootstrapping Databricks CLI: {str(e)}")
+            self.failed_step = 'install'
+            return False
+        
+        steps = self._split_steps(result.stdout)
+        if len(steps) < 4:
+            self.logger.error(f"Databricks CLI bootstrap did not complete: {result.stderr}")
+            self.failed_step = 'install'
+            return False
+        (install_output, _), (resolved_output, _), (version_output, version_code), (user_output, user_code) = steps[:4]
+        # Per-step stderr, so failures report only the output of the step that failed
+        step_errors = [error for error, _ in self._split_steps(result.stderr)]
+        step_errors += [result.stderr] * (4 - len(step_errors))
+        
+        self.logger.debug(install_output)
+        cli_path = self._parse_install_path(install_output)
+        if not cli_path:
+            self.logger.error("Failed to determine CLI installation path.")
+            self.failed_step = 'install'
+            return False
+        self.cli_path = cli_path
+        self.is_installed = True
+        self.logger.debug(f"Databricks CLI installed to path: {self.cli_path}")
+        
+        resolved_path = resolved_output.strip()
+        if not resolved_path or os.path.realpath(resolved_path) != os.path.realpath(cli_path):
+            # The script ran a different binary; check the installed one directly
+            self.logger.debug(f"Bootstrap resolved CLI to '{resolved_path}', verifying installed path instead")
+            if not self.verify_installation():
+                self.failed_step = 'verify'
+                return False
+            if not self.test_authentication():
+                self.failed_step = 'auth_test'
+                return False
+            return True
+        
+        if version_code != 0:
+            self.logger.error(f"CLI verification failed: {step_errors[2]}")
+            self.failed_step = 'verify'
+            return False
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"CLI verification successful: {version_output.strip()}")
+        
+        self.is_authenticated = user_code == 0
+        if not self.is_authenticated:
+            self.logger.error(f"Authentication test failed: {step_errors[3]}")
+            self.failed_step = 'auth_test'
+            return False
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Authentication test successful: {user_output.strip()}")
+        return True
+    
+    @staticmethod
+    def _split_steps(output: str) -> List[Tuple[str, int]]:
+        """
+        Split the fused bootstrap output into per-step output and exit codes.
+        
+        Each step ends with a sentinel line printed by the script's step_done;
+        the newline printed before the sentinel is not part of the step output.
+        
+        Args:
+            output: Standard output or standard error of the bootstrap script
+            
+        Returns:
+            List of (step_output, exit_code) tuples in execution order
+        """
+        steps = []
+        step_lines = []
+        for line in output.splitlines():
+            stripped = line.strip()
+            if stripped.startswith(_STEP_SENTINEL):
+                code = stripped[len(_STEP_SENTINEL):].strip()
+                if step_lines and not step_lines[-1]:
+                    step_lines.pop()
+                steps.append(("\n".join(step_lines), int(code) if code.isdigit() else 1))
+                step_lines = []
+            else:
+                step_lines.append(line)
+        return steps
+
+    @staticmethod
+    def _iter_generated_files(path: str) -> Iterator[str]:
+        """
+        Recursively yield generated source/config files under a directory.
+        
+        Args:
+            path: Directory to scan
+            
+        Yields:
+            Paths of files whose extension is in _GENERATED_FILE_EXTENSIONS
+        """
+        subdirs = []
+        # Like os.walk, skip directories that cannot be listed or vanish while scanning
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, do not descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in _GENERATED_FILE_EXTENSIONS:
+                        yield entry.path
+        except OSError:
+            pass
+        
+        for subdir in subdirs:
+            yield from DatabricksCliManager._iter_generated_files(subdir)
+
+    def _prepare_workdir(self, databricks_yml_path: str, start_path: str) -> str:
+        """
+        Ensure start_path exists and contains the configured databricks.yml.
+        
+        The file is hardlinked when possible and copied otherwise; staging is
+        skipped when the same source file (same inode, mtime and size) has
+        already been staged into start_path by an earlier call.
+        
+        Args:
+            databricks_yml_path: Path to the databricks.yml file from config
+            start_path: Directory where bundle files are generated
+            
+        Returns:
+            str: Path to the databricks.yml inside start_path
+        """
+        os.makedirs(start_path, exist_ok=True)
+        target_databricks_yml = os.path.join(start_path, "databricks.yml")
+        
+        # Check if config path and start path are different (stat-based, so
+        # symlinks and case-insensitive paths are recognised as the same directory)
+        source_dir = os.path.dirname(databricks_yml_path) or "."
+        if os.path.exists(source_dir) and os.path.samefile(source_dir, start_path):
+            self.logger.debug(f"databricks.yml already in target directory, no copy needed: {target_databricks_yml}")
+            return target_databricks_yml
+        
+        source_stat = os.stat(databricks_yml_path)
+        signature = (source_stat.st_ino, source_stat.st_mtime_ns, source_stat.st_size)
+        # Resolved paths, so relative/symlinked spellings of the same pair share an entry
+        key = (os.path.realpath(databricks_yml_path), os.path.realpath(start_path))
+        if self._staged_yml.get(key) == signature and os.path.exists(target_databricks_yml):
+            self.logger.debug(f"databricks.yml already staged, no copy needed: {target_databricks_yml}")
+            return target_databricks_yml
+        
+        # Link/replace databricks.yml from config path to start path
+        if os.path.lexists(target_databricks_yml):
+            os.remove(target_databricks_yml)
+        try:
+            # Same filesystem: a hardlink moves no bytes
+            os.link(databricks_yml_path, target_databricks_yml)
+            self.logger.debug(f"Linked databricks.yml into target directory: {target_databricks_yml}")
+        except OSError:
+            # Cross-device or links not permitted
+            shutil.copy2(databricks_yml_path, target_databricks_yml)
+            self.logger.debug(f"Copied databricks.yml to target directory: {target_databricks_yml}")
+        self._staged_yml[key] = signature
+        return target_databricks_yml
+
     def generate_yaml_src_files_from_pipeline_id(self, pipeline_id: str, start_path: str, databricks_yml_path: str) -> Tuple[Union[List[str], str], str]:
         """
         Generates YAML and source files for a given Databricks pipeline ID.
@@ -348,38 +700,43 @@ class DatabricksCliManager:
         Returns:
             Tuple containing either list of file paths or error message, and status
         """
+        output, status = self.iter_yaml_src_files_from_pipeline_id(pipeline_id, start_path, databricks_yml_path)
+        if status == "success":
+            output = list(output)
+            self.logger.debug(f"Found {len(output)} generated files")
+        return output, status
+
+    def iter_yaml_src_files_from_pipeline_id(self, pipeline_id: str, start_path: str, databricks_yml_path: str) -> Tuple[Union[Iterator[str], str], str]:
+        """
+        Generates YAML and source files for a given Databricks pipeline ID, lazily listing them.
+        
+        The generated files are discovered while the returned iterator is consumed,
+        so callers that only need the status never scan start_path.
+        
+        Args:
+            pipeline_id: The Databricks pipeline ID
+            start_path: Starting path for file generation (where files should be created)
+            databricks_yml_path: Path to the databricks.yml file from config
+            
+        Returns:
+            Tuple containing either an iterator of file paths or error message, and status
+        """
         self.logger.debug(f"Generating YAML and source files for pipeline ID: {pipeline_id}")
         
         # Verify databricks.yml exists at the configured path
         if not os.path.exists(databricks_yml_path):
-            self.logger.error(f"databricks.yml not found at configured path: {databricks_yml_path}")
-            self.logger.error("Please ensure the databricks.yml file exists at the path specified in config: v_databricks_yml_path")
+            self.logger.error(
+                f"databricks.yml not found at configured path: {databricks_yml_path}\n"
+                "Please ensure the databricks.yml file exists at the path specified in config: v_databricks_yml_path"
+            )
             return f"databricks.yml not found at: {databricks_yml_path}", "failed"
         
         self.logger.debug(f"Using databricks.yml from: {databricks_yml_path}")
         
-        # Ensure the start_path directory exists
-        if not os.path.exists(start_path):
-            os.makedirs(start_path, exist_ok=True)
-            self.logger.debug(f"Created start_path directory: {start_path}")
-        
-        # Handle databricks.yml file placement
-        target_databricks_yml = os.path.join(start_path, "databricks.yml")
-        
         try:
-            # Check if config path and start path are different
-            if os.path.abspath(os.path.dirname(databricks_yml_path)) != os.path.abspath(start_path):
-                # Copy/replace databricks.yml from config path to start path
-                import shutil
-                shutil.copy2(databricks_yml_path, target_databricks_yml)
-                if os.path.exists(target_databricks_yml):
-                    self.logger.debug(f"Replaced existing databricks.yml in target directory: {target_databricks_yml}")
-                else:
-                    self.logger.debug(f"Copied databricks.yml to target directory: {target_databricks_yml}")
-            else:
-                self.logger.debug(f"databricks.yml already in target directory, no copy needed: {target_databricks_yml}")
+            # Ensure start_path exists and holds the configured databricks.yml
+            self._prepare_workdir(databricks_yml_path, start_path)
             
-            # Generate command for pipeline
             command = [
                 self.cli_path,
                 "bundle", "generate", "pipeline",
@@ -387,32 +744,22 @@ class DatabricksCliManager:
                 "--force"
             ]
             
-            self.logger.debug(f"Executing command: {' '.join(command)}")
-            self.logger.debug(f"Working directory: {start_path}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Executing command: {' '.join(command)}")
+                self.logger.debug(f"Working directory: {start_path}")
             
             # Execute the bundle generate pipeline command
-            result = subprocess.run(
-                command,
-                cwd=start_path,
-                capture_output=True,
-                text=True
-            )
+            result = self._run(command, cwd=start_path)
             
-            self.logger.debug(f"Command output: {result.stdout}")
-            self.logger.debug(f"Command stderr: {result.stderr}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Command output: {result.stdout}")
+                self.logger.debug(f"Command stderr: {result.stderr}")
             
             if result.returncode == 0:
                 self.logger.debug(f"Successfully generated pipeline bundle for pipeline ID: {pipeline_id}")
                 
-                # Find generated files in the start_path
-                generated_files = []
-                for root, dirs, files in os.walk(start_path):
-                    for file in files:
-                        if file.endswith(('.yml', '.yaml', '.py', '.sql', '.json')):
-                            generated_files.append(os.path.join(root, file))
-                
-                self.logger.debug(f"Found {len(generated_files)} generated files")
-                return generated_files, "success"
+                # Generated files in the start_path, discovered as they are consumed
+                return self._iter_generated_files(start_path), "success"
             else:
                 error_msg = f"Pipeline bundle generation failed: {result.stderr}"
                 self.logger.error(error_msg)
@@ -439,56 +786,38 @@ class DatabricksCliManager:
         
         # Verify databricks.yml exists at the configured path
         if not os.path.exists(databricks_yml_path):
-            self.logger.error(f"databricks.yml not found at configured path: {databricks_yml_path}")
-            self.logger.error("Please ensure the databricks.yml file exists at the path specified in config: v_databricks_yml_path")
+            self.logger.error(
+                f"databricks.yml not found at configured path: {databricks_yml_path}\n"
+                "Please ensure the databricks.yml file exists at the path specified in config: v_databricks_yml_path"
+            )
             return f"databricks.yml not found at: {databricks_yml_path}", "failed"
         
         self.logger.debug(f"Using databricks.yml from: {databricks_yml_path}")
         
-        # Ensure the start_path directory exists
-        if not os.path.exists(start_path):
-            os.makedirs(start_path, exist_ok=True)
-            self.logger.debug(f"Created start_path directory: {start_path}")
-        
-        # Handle databricks.yml file placement
-        target_databricks_yml = os.path.join(start_path, "databricks.yml")
-        
         try:
-            # Check if config path and start path are different
-            if os.path.abspath(os.path.dirname(databricks_yml_path)) != os.path.abspath(start_path):
-                # Copy/replace databricks.yml from config path to start path
-                import shutil
-                shutil.copy2(databricks_yml_path, target_databricks_yml)
-                if os.path.exists(target_databricks_yml):
-                    self.logger.debug(f"Replaced existing databricks.yml in target directory: {target_databricks_yml}")
-                else:
-                    self.logger.debug(f"Copied databricks.yml to target directory: {target_databricks_yml}")
-            else:
-                self.logger.debug(f"databricks.yml already in target directory, no copy needed: {target_databricks_yml}")
+            # Ensure start_path exists and holds the configured databricks.yml
+            self._prepare_workdir(databricks_yml_path, start_path)
             
-            # Define the shell command - run from start_path directory
-            command = f'''
-                cd {start_path}; 
-                {self.cli_path} bundle generate job --existing-job-id {job_id}'''
+            command = [
+                self.cli_path,
+                "bundle", "generate", "job",
+                "--existing-job-id", str(job_id)
+            ]
 
-            # Run the command
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True, 
-                text=True,
-                executable='/bin/bash'
-            )
+            # Run the command from the start_path directory
+            result = self._run_stderr_only(command, cwd=start_path)
             
             # Check if the command succeeded
             if result.returncode == 0:
                 status_message = f"Command 'bundle generate job' executed successfully for job id: {job_id}"
                 self.logger.debug(status_message)
                 file_paths = [
-                    re.search(r'(src|resources)/[^\n\r]+', file).group(0) if re.search(r'(src|resources)/[^\n\r]+', file) else ''
-                    for file in result.stderr.split('\n')
+                    match.group(0)
+                    for line in result.stderr.splitlines()
+                    if (match := _GENERATED_FILE_RE.search(line))
                 ]
-                self.logger.debug(f"Generated files: {file_paths}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Generated files: {file_paths}")
                 return file_paths, "success"
             else:
                 self.logger.error(f"Command failed with return code {result.returncode}.")
@@ -497,4 +826,4 @@ class DatabricksCliManager:
                 
         except Exception as e:
             self.logger.error(f"An error occurred while generating files: {e}")
-            return str(e), "failed"
\ No newline at end of file
+            return str(e), "failed"
@@ -0,0 +1,22 @@
+"""
+`wf-export export` command.
+
+This module defines the legacy export command, kept for backward compatibility.
+"""
+
+import click
+
+from .cli_errors import _handle_cli_errors
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config.yml file')
+@click.option('--host', help='Databricks workspace URL (optional if using profile or running in Databricks)')
+@click.option('--token', help='Databricks access token (optional if using profile or running in Databricks)')
+@_handle_cli_errors
+def export(config, host, token):
+    """Export Databricks workflows and pipelines (legacy command - use 'run' instead)."""
+    from ..main import main
+    
+    # Delegate to the main function
+    main(config, host, token)
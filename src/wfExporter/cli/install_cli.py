@@ -4,101 +4,304 @@ Installation CLI module for WF Exporter.
 This module handles interactive installation of Databricks workflows and apps.
 """
 
+import configparser
+import functools
 import logging
 import click
 import os
-import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-
-# Add the src directory to Python path for imports
-src_path = Path(__file__).parent.parent
-sys.path.insert(0, str(src_path))
+from typing import Optional, List, Dict, Any, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-try:
-    from ..installer.workflow_installer import WorkflowInstaller
-    from ..installer.app_installer import AppInstaller, ActiveDeploymentError
-    from ..installer.config_generator import ConfigGenerator
-    _installer_available = True
-except ImportError as e:
-    logger.error(f"Installer modules not available: {e}")
-    _installer_available = False
-    WorkflowInstaller = None
-    AppInstaller = None
-    ActiveDeploymentError = None
-    ConfigGenerator = None
+# Seconds a cached `status` result is reused
+_STATUS_CACHE_TTL = 30
+
+# Parsed (profiles, default profile) keyed by (config path, st_mtime_ns, st_size)
+_profiles_cache: Dict[Tuple[str, int, int], Tuple[List[str], Optional[str]]] = {}
+
+# Section of .databrickscfg holding CLI settings rather than a profile
+_SETTINGS_SECTION = '__settings__'
+
+
+def _invalidate_profiles_cache() -> None:
+    """Forget previously parsed .databrickscfg profile lists."""
+    _profiles_cache.clear()
+
+
+def _databrickscfg_path() -> Path:
+    """Path of the Databricks config file, honouring DATABRICKS_CONFIG_FILE like the SDK."""
+    config_file = os.environ.get('DATABRICKS_CONFIG_FILE')
+    if config_file:
+        return Path(config_file).expanduser()
+    return Path.home() / '.databrickscfg'
+
+
+def _read_profiles() -> Tuple[List[str], Optional[str]]:
+    """
+    Parse the Databricks config file, reusing the previous parse while it is unchanged.
+    
+    Returns:
+        (profile names, default profile from [__settings__] or None)
+    """
+    config_file = _databrickscfg_path()
+    # A missing or unreadable file is reported by the call itself; no exists() probe
+    try:
+        st = config_file.stat()
+    except (FileNotFoundError, PermissionError):
+        return [], None
+    
+    # Reuse the previous parse while the file is unchanged
+    key = (str(config_file), st.st_mtime_ns, st.st_size)
+    cached = _profiles_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    parser = configparser.ConfigParser(default_section='DEFAULT', interpolation=None, strict=False)
+    try:
+        f = open(config_file, 'r')
+    except (FileNotFoundError, PermissionError):
+        return [], None
+    with f:
+        # Key the cache by the handle that is actually parsed
+        st = os.fstat(f.fileno())
+        key = (str(config_file), st.st_mtime_ns, st.st_size)
+        parser.read_file(f)
+    
+    # Include all profiles including DEFAULT
+    profiles = [section for section in parser.sections() if section != _SETTINGS_SECTION]
+    if parser.defaults():
+        profiles.insert(0, 'DEFAULT')
+    
+    default_profile = parser.get(_SETTINGS_SECTION, 'default_profile', fallback=None) or None
+    
+    _profiles_cache.clear()
+    _profiles_cache[key] = (profiles, default_profile)
+    return profiles, default_profile
 
 
 def get_available_profiles() -> List[str]:
     """Get list of available Databricks profiles from .databrickscfg."""
     try:
-        from databricks.sdk import WorkspaceClient
-        from databricks.sdk.core import Config
-        
-        # Try to get profiles from the config
-        config_file = Path.home() / '.databrickscfg'
-        if not config_file.exists():
-            return []
-        
-        profiles = []
-        current_section = None
-        
-        with open(config_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('[') and line.endswith(']'):
-                    profile_name = line[1:-1]
-                    if profile_name:
-                        # Include all profiles including DEFAULT
-                        profiles.append(profile_name)
-        
-        return profiles
+        profiles, _ = _read_profiles()
+        return list(profiles)
     except Exception:
         return []
 
 
-def validate_profile(profile: str) -> bool:
-    """Validate that a Databricks profile is working."""
+def get_default_profile() -> Optional[str]:
+    """Get the default profile configured in the [__settings__] section of .databrickscfg."""
     try:
-        from databricks.sdk import WorkspaceClient
+        _, default_profile = _read_profiles()
+        return default_profile
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config(profile: str):
+    """
+    Load the Databricks config for a profile once per process.
+    
+    The same Config is used for validation and handed to the installers, so
+    .databrickscfg is read a single time per profile.
+    
+    Returns:
+        databricks.sdk.core.Config for the profile
+    """
+    from databricks.sdk.core import Config
+    
+    return Config(profile=profile)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_client(profile: str):
+    """
+    Build one WorkspaceClient per profile and reuse it for validation and installs.
+    
+    Returns:
+        databricks.sdk.WorkspaceClient for the profile
+    """
+    from databricks.sdk import WorkspaceClient
+    
+    return WorkspaceClient(config=_load_config(profile))
+
+
+@functools.lru_cache(maxsize=32)
+def _current_user_name(profile: str) -> str:
+    """
+    Look up the user behind a Databricks profile once per process.
+    
+    Failures raise and are therefore not cached, so a later retry checks again.
+    
+    Returns:
+        Display name of the authenticated user
+    """
+    client = _get_client(profile)
+    # Try to get current user to validate connection
+    return client.current_user.me().display_name
+
+
+def _validate(profile: str) -> Tuple[bool, str]:
+    """
+    Check a Databricks profile, reusing an earlier successful check.
+    
+    Returns:
+        (True, user display name) on success, (False, error message) otherwise
+    """
+    try:
+        return True, _current_user_name(profile)
+    except Exception as e:
+        return False, str(e)
+
+
+def validate_profile(profile: str, result: Optional[Tuple[bool, str]] = None) -> bool:
+    """
+    Validate that a Databricks profile is working.
+    
+    Args:
+        profile: Profile to validate
+        result: Result of a validation that already ran in the background, if any
+    """
+    valid, detail = result if result is not None else _validate(profile)
+    if valid:
+        click.echo(f"✅ Authenticated as: {detail}")
+    else:
+        click.echo(f"❌ Failed to validate profile '{profile}': {detail}", err=True)
+    return valid
+
+
+def _prefetch_validation(profiles: List[str]) -> Dict[str, Future]:
+    """
+    Start validating profiles in the background.
+    
+    Each check runs on a daemon thread: executor workers are joined at interpreter
+    exit, so an unreachable host could keep the command alive after it finished.
+    
+    Args:
+        profiles: Profiles to validate
         
-        client = WorkspaceClient(profile=profile)
-        # Try to get current user to validate connection
-        user = client.current_user.me()
-        click.echo(f"✅ Authenticated as: {user.display_name}")
+    Returns:
+        Mapping of profile name to the future of its _validate() result
+    """
+    if not profiles:
+        return {}
+    
+    futures = {}
+    for profile in profiles:
+        future = Future()
+        future.set_running_or_notify_cancel()
+        # _validate() reports failures in its result, so it never raises
+        threading.Thread(
+            target=lambda p=profile, f=future: f.set_result(_validate(p)),
+            name=f"wfx-profile-{profile}",
+            daemon=True
+        ).start()
+        futures[profile] = future
+    return futures
+
+
+def _await_validation(profile: str, futures: Dict[str, Future]) -> Optional[Tuple[bool, str]]:
+    """
+    Wait for a prefetched validation, showing a spinner if it is still running.
+    
+    The future is removed from futures, so a retry of the same profile validates afresh.
+    
+    Args:
+        profile: Profile being validated
+        futures: Futures returned by _prefetch_validation()
+        
+    Returns:
+        The prefetched (valid, detail) result, or None if the profile was not prefetched
+    """
+    future = futures.pop(profile, None)
+    if future is None:
+        return None
+    if future.done():
+        return future.result()
+    
+    from .progress_indicator import progress_indicator
+    with progress_indicator(f"Validating profile '{profile}'..."):
+        return future.result()
+
+
+def _finish_profile_validation(profile: Optional[str], pending: Dict[str, Future]) -> bool:
+    """
+    Complete a profile validation that was started in the background.
+    
+    Args:
+        profile: Selected profile
+        pending: Futures from _prefetch_validation(); emptied once validation is done
+        
+    Returns:
+        True if there is nothing left to validate or the profile is valid
+    """
+    if not pending:
         return True
-    except Exception as e:
-        click.echo(f"❌ Failed to validate profile '{profile}': {e}", err=True)
+    
+    click.echo(f"\nValidating profile '{profile}'...")
+    result = _await_validation(profile, pending)
+    pending.clear()
+    if not validate_profile(profile, result):
+        click.echo(f"Installation cancelled: Profile '{profile}' is invalid.")
         return False
+    return True
+
+
+def _shared_profile_objects(profile: Optional[str]) -> Tuple[Any, Any]:
+    """
+    Return the config and client shared by every installer for a profile.
+    
+    Args:
+        profile: Validated profile, or None to let installers use the default auth
+        
+    Returns:
+        (Config, WorkspaceClient) for the profile, or (None, None)
+    """
+    if not profile:
+        return None, None
+    return _load_config(profile), _get_client(profile)
 
 
 def prompt_profile_selection(available_profiles: List[str]) -> Optional[str]:
     """Prompt user to select a Databricks profile."""
     if not available_profiles:
-        click.echo("No Databricks profiles found in ~/.databrickscfg")
+        click.echo(f"No Databricks profiles found in {_databrickscfg_path()}")
         click.echo("Please configure a profile first using: databricks configure")
         return None
     
+    default_profile = get_default_profile()
+    default_choice = None
+    if default_profile in available_profiles:
+        default_choice = available_profiles.index(default_profile) + 1
+    
     click.echo("\nAvailable Databricks profiles:")
     for i, profile in enumerate(available_profiles, 1):
-        click.echo(f"  {i}. {profile}")
+        marker = " (default)" if i == default_choice else ""
+        click.echo(f"  {i}. {profile}{marker}")
+    
+    # Only the default profile is validated while the user is choosing; other
+    # profiles may start OAuth flows or contact workspaces the user never picks
+    validations = _prefetch_validation([default_profile] if default_choice else [])
     
     while True:
         try:
             choice = click.prompt(
                 f"\nSelect profile (1-{len(available_profiles)})",
-                type=int
+                type=int,
+                default=default_choice
             )
             if 1 <= choice <= len(available_profiles):
                 selected_profile = available_profiles[choice - 1]
                 
                 # Validate the selected profile
                 click.echo(f"Validating profile '{selected_profile}'...")
-                if validate_profile(selected_profile):
+                result = _await_validation(selected_profile, validations)
+                if validate_profile(selected_profile, result):
                     click.echo(f"✓ Profile '{selected_profile}' validated successfully")
                     return selected_profile
                 else:
@@ -126,9 +329,36 @@ def show_folders_to_create(component: str) -> None:
     else:
         return
     
-    click.echo(f"\nThe following workspace folders will be created for {component}:")
-    for folder in folders:
-        click.echo(f"  • {folder}")
+    lines = [f"\nThe following workspace folders will be created for {component}:"]
+    lines.extend(f"  • {folder}" for folder in folders)
+    click.echo("\n".join(lines))
+
+
+def _print_app_success(app_info: Dict[str, Any]) -> None:
+    """
+    Print the summary shown after a successful app installation.
+    
+    Args:
+        app_info: Result of AppInstaller.install() or install_with_force_delete()
+    """
+    app_id = app_info.get('app_id')
+    lines = [
+        "✅ App installed successfully!",
+        f"   App Name: {app_info.get('app_name')}",
+    ]
+    if app_id:
+        lines.append(f"   App ID: {app_id}")
+    lines.append(f"   App URL: {app_info.get('app_url')}")
+    
+    # Display permission status if app_id is available
+    if app_id:
+        lines.append(f"   🔐 Permissions set for app_id: {app_id}")
+    
+    # Display deployment info
+    if app_info.get('deployment_id'):
+        lines.append(f"   🚀 Deployment ID: {app_info.get('deployment_id')}")
+    
+    click.echo("\n".join(lines))
 
 
 def run_install(
@@ -156,8 +386,14 @@ def run_install(
     from ..cli_entry import _configure_logging
     _configure_logging(log_level)
     
-    # Check if installer modules are available
-    if not _installer_available:
+    # Installer modules pull in the Databricks SDK; import them only when installing
+    try:
+        from ..installer.workflow_installer import WorkflowInstaller
+        from ..installer.app_installer import AppInstaller, ActiveDeploymentError
+        from ..installer.config_generator import ConfigGenerator
+        from .progress_indicator import InstallationProgress
+    except ImportError as e:
+        logger.error(f"Installer modules not available: {e}")
         click.echo("❌ Error: Installer modules are not available.")
         click.echo("💡 Make sure all dependencies are installed: pip install wfexporter")
         return
@@ -165,13 +401,23 @@ def run_install(
     click.echo("🚀 WF Exporter Installation Wizard")
     click.echo("=" * 40)
     
+    # Whatever happens below, a previously cached status is no longer trustworthy
+    _invalidate_status_cache()
+    
     # Profile selection
+    pending_validation: Dict[str, Future] = {}
     if not profile and interactive:
         available_profiles = get_available_profiles()
-        profile = prompt_profile_selection(available_profiles)
-        if not profile:
-            click.echo("Installation cancelled: No valid profile selected.")
-            return
+        if len(available_profiles) == 1:
+            # Nothing to choose: validate in the background while the wizard continues
+            profile = available_profiles[0]
+            click.echo(f"\nUsing the only available Databricks profile: {profile}")
+            pending_validation = _prefetch_validation([profile])
+        else:
+            profile = prompt_profile_selection(available_profiles)
+            if not profile:
+                click.echo("Installation cancelled: No valid profile selected.")
+                return
     elif profile:
         # Validate provided profile
         if not validate_profile(profile):
@@ -188,10 +434,12 @@ def run_install(
         if serverless is None and interactive:
             serverless = click.confirm("\n⚡ Is your workspace serverless enabled?", default=True)
         
+        if not _finish_profile_validation(profile, pending_validation):
+            return
+        config, client = _shared_profile_objects(profile)
+        
         try:
-            from .progress_indicator import InstallationProgress
-            
-            workflow_installer = WorkflowInstaller(profile=profile, interactive=interactive)
+            workflow_installer = WorkflowInstaller(profile=profile, interactive=interactive, config=config, client=client)
             progress = InstallationProgress()
             
             click.echo(f"\n🔧 Installing workflow with {'serverless' if serverless else 'job cluster'} configuration...")
@@ -206,7 +454,9 @@ def run_install(
             click.echo(f"❌ Workflow installation failed: {e}", err=True)
             return
     
-    # App installation
+    # App installation. This deliberately runs after the workflow install rather
+    # than alongside it: the workflow step writes the job id into
+    # wf_app/app_config.yml, which the app step uploads and reads for permissions.
     if install_app is None and interactive:
         install_app = click.confirm("\n🌐 Install web application?", default=True)
     
@@ -219,27 +469,18 @@ def run_install(
         if install_app:
             show_folders_to_create("app")
             
+            if not _finish_profile_validation(profile, pending_validation):
+                return
+            config, client = _shared_profile_objects(profile)
+            
             try:
-                app_installer = AppInstaller(profile=profile)
+                app_installer = AppInstaller(profile=profile, config=config, client=client)
                 app_progress = InstallationProgress()
                 
                 click.echo(f"\n🔧 Installing web application...")
                 
                 app_info = app_installer.install(progress=app_progress)
-                
-                click.echo(f"✅ App installed successfully!")
-                click.echo(f"   App Name: {app_info.get('app_name')}")
-                if app_info.get('app_id'):
-                    click.echo(f"   App ID: {app_info.get('app_id')}")
-                click.echo(f"   App URL: {app_info.get('app_url')}")
-                
-                # Display permission status if app_id is available
-                if app_info.get('app_id'):
-                    click.echo(f"   🔐 Permissions set for app_id: {app_info.get('app_id')}")
-                
-                # Display deployment info
-                if app_info.get('deployment_id'):
-                    click.echo(f"   🚀 Deployment ID: {app_info.get('deployment_id')}")
+                _print_app_success(app_info)
                 
             except ActiveDeploymentError as e:
                 click.echo(f"❌ App installation failed: {e}", err=True)
@@ -253,15 +494,7 @@ def run_install(
                         click.echo("⚠️  Deleting existing app and recreating...")
                         app_progress = InstallationProgress()
                         app_info = app_installer.install_with_force_delete(progress=app_progress)
-                        click.echo(f"✅ App installed successfully!")
-                        click.echo(f"   App Name: {app_info.get('app_name')}")
-                        if app_info.get('app_id'):
-                            click.echo(f"   App ID: {app_info.get('app_id')}")
-                        click.echo(f"   App URL: {app_info.get('app_url')}")
-                        if app_info.get('app_id'):
-                            click.echo(f"   🔐 Permissions set for app_id: {app_info.get('app_id')}")
-                        if app_info.get('deployment_id'):
-                            click.echo(f"   🚀 Deployment ID: {app_info.get('deployment_id')}")
+                        _print_app_success(app_info)
                     except Exception as delete_e:
                         click.echo(f"❌ Failed to delete and recreate app: {delete_e}", err=True)
                         click.echo("💡 You may need to manually delete the app in the Databricks UI and try again.")
@@ -305,41 +538,138 @@ def run_install(
         click.echo("3. Access your web app at the URL shown above")
 
 
-def show_status() -> None:
-    """Show installation status of WF Exporter components."""
+def _status_cache_path() -> Path:
+    """Location of the cached installation status."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(cache_home) / 'wfexporter' / 'status.json'
+
+
+def _status_cache_key() -> str:
+    """
+    Identify the workspace, credentials and directory a cached status belongs to.
+    
+    The token and the config file's (mtime, size) only enter as a digest, so no
+    credential is written to the cache file; editing the config file or switching
+    credentials therefore misses the cache.
+    """
+    import hashlib
+    
+    config_file = _databrickscfg_path()
+    try:
+        st = config_file.stat()
+        config_signature = f"{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        config_signature = ''
+    credentials = "\0".join((os.environ.get('DATABRICKS_TOKEN', ''), config_signature))
+    return "|".join((
+        os.environ.get('DATABRICKS_CONFIG_PROFILE', ''),
+        os.environ.get('DATABRICKS_HOST', ''),
+        str(config_file),
+        hashlib.sha256(credentials.encode()).hexdigest(),
+        os.getcwd(),
+    ))
+
+
+def _load_cached_status() -> Optional[Dict[str, Any]]:
+    """
+    Return the cached installation status if it is fresh and for this workspace.
+    
+    Returns:
+        The cached status dictionary, or None on a miss
+    """
+    import json
+    import time
+    
+    cache_file = _status_cache_path()
+    try:
+        if time.time() - cache_file.stat().st_mtime > _STATUS_CACHE_TTL:
+            return None
+        with open(cache_file, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get('key') != _status_cache_key():
+        return None
+    return cached.get('status')
+
+
+def _save_cached_status(status: Dict[str, Any]) -> None:
+    """
+    Cache an installation status for subsequent status checks.
+    
+    Args:
+        status: Result of InstallerCore.get_installation_status()
+    """
+    import json
+    
+    cache_file = _status_cache_path()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({'key': _status_cache_key(), 'status': status}, f)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not cache installation status: {e}")
+
+
+def _invalidate_status_cache() -> None:
+    """Drop the cached installation status."""
+    try:
+        _status_cache_path().unlink()
+    except OSError:
+        pass
+
+
+def show_status(refresh: bool = False) -> None:
+    """
+    Show installation status of WF Exporter components.
+    
+    Args:
+        refresh: Ignore the cached status and query the workspace
+    """
     click.echo("🔍 WF Exporter Installation Status")
     click.echo("=" * 35)
     
     try:
-        from ..installer.installer_core import InstallerCore
-        core = InstallerCore()
+        if refresh:
+            _invalidate_status_cache()
         
-        status = core.get_installation_status()
+        status = _load_cached_status()
+        if status is None:
+            from ..installer.installer_core import InstallerCore
+            core = InstallerCore()
+            
+            status = core.get_installation_status()
+            _save_cached_status(status)
+        
+        lines = []
         
         # Workflow status
         workflow_status = status.get('workflow', {})
         if workflow_status.get('installed'):
-            click.echo("📋 Workflow: ✅ Installed")
-            click.echo(f"   Job ID: {workflow_status.get('job_id', 'Unknown')}")
-            click.echo(f"   Job Name: {workflow_status.get('job_name', 'Unknown')}")
+            lines.append("📋 Workflow: ✅ Installed")
+            lines.append(f"   Job ID: {workflow_status.get('job_id', 'Unknown')}")
+            lines.append(f"   Job Name: {workflow_status.get('job_name', 'Unknown')}")
         else:
-            click.echo("📋 Workflow: ❌ Not installed")
+            lines.append("📋 Workflow: ❌ Not installed")
         
         # App status
         app_status = status.get('app', {})
         if app_status.get('installed'):
-            click.echo("🌐 App: ✅ Installed")
-            click.echo(f"   App Name: {app_status.get('app_name', 'Unknown')}")
-            click.echo(f"   App URL: {app_status.get('app_url', 'Unknown')}")
+            lines.append("🌐 App: ✅ Installed")
+            lines.append(f"   App Name: {app_status.get('app_name', 'Unknown')}")
+            lines.append(f"   App URL: {app_status.get('app_url', 'Unknown')}")
         else:
-            click.echo("🌐 App: ❌ Not installed")
+            lines.append("🌐 App: ❌ Not installed")
         
         # Configuration files
         config_status = status.get('configs', {})
         if config_status.get('present'):
-            click.echo("📄 Sample Configs: ✅ Present in current directory")
+            lines.append("📄 Sample Configs: ✅ Present in current directory")
         else:
-            click.echo("📄 Sample Configs: ❌ Not found in current directory")
+            lines.append("📄 Sample Configs: ❌ Not found in current directory")
+        
+        click.echo("\n".join(lines))
             
     except Exception as e:
         click.echo(f"❌ Failed to check status: {e}", err=True)
@@ -366,6 +696,8 @@ def run_uninstall(
         click.echo("No components specified for uninstallation.")
         return
     
+    _invalidate_status_cache()
+    
     try:
         from ..installer.installer_core import InstallerCore
         core = InstallerCore()
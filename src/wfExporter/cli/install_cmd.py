@@ -0,0 +1,43 @@
+"""
+`wf-export install` command.
+
+This module defines the command that installs WF Exporter into a Databricks workspace.
+"""
+
+import sys
+
+import click
+
+
+@click.command()
+@click.option('--workflow/--no-workflow', default=None, help='Install workflow component')
+@click.option('--app/--no-app', default=None, help='Install app component')
+@click.option('--profile', help='Databricks profile to use')
+@click.option('--serverless/--job-cluster', default=None, help='Use serverless or job cluster configuration')
+@click.option('--generate-samples/--no-samples', default=None, help='Generate sample configuration files')
+@click.option('--interactive/--non-interactive', default=True, help='Run in interactive mode')
+@click.option('--log-level', 
+              type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR'], case_sensitive=False),
+              default='WARNING',
+              help='Set the logging level for the installation process')
+def install(workflow, app, profile, serverless, generate_samples, interactive, log_level):
+    """Install WF Exporter workflow and/or app to Databricks workspace."""
+    # Import here to avoid circular imports and ensure CLI loads quickly
+    from .install_cli import run_install
+    
+    try:
+        run_install(
+            install_workflow=workflow,
+            install_app=app,
+            profile=profile,
+            serverless=serverless,
+            generate_samples=generate_samples,
+            interactive=interactive,
+            log_level=log_level
+        )
+    except KeyboardInterrupt:
+        click.echo("\nInstallation cancelled by user.")
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Installation failed: {e}", err=True)
+        sys.exit(1)
@@ -5,8 +5,8 @@ This module provides utilities for showing progress indicators with spinners
 that update on a single line during CLI operations.
 """
 
+import itertools
 import sys
-import time
 import threading
 from contextlib import contextmanager
 from typing import Optional
@@ -25,8 +25,23 @@ class ProgressIndicator:
         self.message = message
         self.is_running = False
         self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        # Set while frames should be drawn; cleared while paused between steps
+        self._active = threading.Event()
+        # Serializes frame writes with pause/stop line clearing
+        self._lock = threading.Lock()
+        # Animate only on a terminal; pipes and CI logs get plain lines
+        self._interactive = sys.stdout.isatty()
         self.spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-        self.current_char_index = 0
+        # Carriage return + spinner character prefix for each frame, built once
+        self._frames = itertools.cycle([f'\r{char} ' for char in self.spinner_chars])
+        # Width of the last line written, so it can be cleared exactly
+        self._last_len = 0
+        
+    @property
+    def is_paused(self) -> bool:
+        """Whether the indicator is running but not currently animating."""
+        return self.is_running and not self._active.is_set()
         
     def start(self) -> None:
         """Start the progress indicator."""
@@ -34,9 +49,47 @@ class ProgressIndicator:
             return
             
         self.is_running = True
+        self._active.set()
+        if not self._interactive:
+            sys.stdout.write(self.message + '\n')
+            sys.stdout.flush()
+            return
+            
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._animate, daemon=True)
         self.thread.start()
         
+    def pause(self, final_message: Optional[str] = None) -> None:
+        """
+        Stop animating and print a final message, keeping the animation thread alive.
+        
+        Args:
+            final_message: Optional final message to display
+        """
+        if not self.is_running or not self._active.is_set():
+            return
+            
+        with self._lock:
+            self._active.clear()
+            self._finish_line(final_message)
+            
+    def resume(self, message: Optional[str] = None) -> None:
+        """
+        Resume animating after pause(), optionally with a new message.
+        
+        Args:
+            message: New message to display
+        """
+        if message is not None:
+            self.message = message
+        if not self.is_running or self._active.is_set():
+            return
+            
+        if not self._interactive:
+            sys.stdout.write(self.message + '\n')
+            sys.stdout.flush()
+        self._active.set()
+        
     def stop(self, final_message: Optional[str] = None) -> None:
         """
         Stop the progress indicator.
@@ -48,11 +101,37 @@ class ProgressIndicator:
             return
             
         self.is_running = False
+        was_active = self._active.is_set()
+        # Wake the animation thread immediately instead of waiting out its frame delay
+        self._stop_event.set()
+        self._active.set()
         if self.thread:
             self.thread.join()
+            self.thread = None
+        self._active.clear()
+        
+        if was_active:
+            self._finish_line(final_message)
+        elif final_message:
+            sys.stdout.write(final_message + '\n')
+            sys.stdout.flush()
+            
+    def _finish_line(self, final_message: Optional[str]) -> None:
+        """
+        Clear the spinner line and print the final message, if any.
+        
+        Args:
+            final_message: Optional final message to display
+        """
+        if not self._interactive:
+            if final_message:
+                sys.stdout.write(final_message + '\n')
+                sys.stdout.flush()
+            return
             
         # Clear the line completely and show final message
-        sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear entire line
+        sys.stdout.write('\r' + ' ' * self._last_len + '\r')  # Clear exactly what was written
+        self._last_len = 0
         if final_message:
             sys.stdout.write(final_message + '\n')
         else:
@@ -71,16 +150,23 @@ class ProgressIndicator:
         
     def _animate(self) -> None:
         """Animate the spinner."""
-        while self.is_running:
-            spinner_char = self.spinner_chars[self.current_char_index]
-            self.current_char_index = (self.current_char_index + 1) % len(self.spinner_chars)
+        while not self._stop_event.is_set():
+            # Sleep without polling while paused between steps
+            self._active.wait()
             
-            # Write the current state, ensuring we clear any existing content
-            line_content = f'{spinner_char} {self.message}'
-            sys.stdout.write(f'\r{line_content:<60}')  # Pad with spaces to clear previous content
-            sys.stdout.flush()
+            with self._lock:
+                if self._stop_event.is_set() or not self._active.is_set():
+                    continue
+                frame = next(self._frames)
+                
+                # Write the current state, padding over any longer previous content
+                message = self.message
+                sys.stdout.write(frame + message.ljust(self._last_len - 2))
+                sys.stdout.flush()
+                self._last_len = 2 + len(message)
             
-            time.sleep(0.1)
+            if self._stop_event.wait(0.1):
+                break
 
 
 @contextmanager
@@ -105,7 +191,12 @@ def progress_indicator(message: str):
 
 
 class InstallationProgress:
-    """Handles progress indication for the installation process."""
+    """
+    Handles progress indication for the installation process.
+    
+    A single ProgressIndicator (and animation thread) is kept for the whole
+    installation; completed steps pause it and the next step resumes it.
+    """
     
     def __init__(self):
         """Initialize the installation progress tracker."""
@@ -118,11 +209,13 @@ class InstallationProgress:
         Args:
             message: Description of the current step
         """
-        if self.indicator:
-            self.indicator.update_message(message)
-        else:
+        if not self.indicator:
             self.indicator = ProgressIndicator(message)
             self.indicator.start()
+        elif self.indicator.is_paused:
+            self.indicator.resume(message)
+        else:
+            self.indicator.update_message(message)
             
     def complete_step(self, success_message: str) -> None:
         """
@@ -131,9 +224,8 @@ class InstallationProgress:
         Args:
             success_message: Message to show upon completion
         """
-        if self.indicator:
-            self.indicator.stop(f"✅ {success_message}")
-            self.indicator = None
+        if self.indicator and not self.indicator.is_paused:
+            self.indicator.pause(f"✅ {success_message}")
             
     def fail_step(self, error_message: str) -> None:
         """
@@ -142,9 +234,8 @@ class InstallationProgress:
         Args:
             error_message: Error message to display
         """
-        if self.indicator:
-            self.indicator.stop(f"❌ {error_message}")
-            self.indicator = None
+        if self.indicator and not self.indicator.is_paused:
+            self.indicator.pause(f"❌ {error_message}")
             
     def update_step(self, message: str) -> None:
         """
@@ -153,11 +244,11 @@ class InstallationProgress:
         Args:
             message: New message for the current step
         """
-        if self.indicator:
+        if self.indicator and not self.indicator.is_paused:
             self.indicator.update_message(message)
             
     def finish(self) -> None:
         """Finish the installation progress."""
         if self.indicator:
             self.indicator.stop()
-            self.indicator = None 
\ No newline at end of file
+            self.indicator = None
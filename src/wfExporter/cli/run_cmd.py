@@ -0,0 +1,31 @@
+"""
+`wf-export run` command.
+
+This module defines the primary export command of the WF Exporter CLI.
+"""
+
+import click
+
+from ..cli_entry import _configure_logging
+from .cli_errors import _handle_cli_errors
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config.yml file')
+@click.option('--host', help='Databricks workspace URL (optional if using profile or running in Databricks)')
+@click.option('--token', help='Databricks access token (optional if using profile or running in Databricks)')
+@click.option('--log-level', 
+              type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR'], case_sensitive=False),
+              default='INFO',
+              help='Set the logging level for this command')
+@click.pass_context
+@_handle_cli_errors
+def run(ctx, config, host, token, log_level):
+    """Run the Databricks workflow and pipeline export process."""
+    # Override the global log level with command-specific log level
+    _configure_logging(log_level)
+    
+    from ..main import main
+    
+    # Delegate to the main function with log level
+    main(config, host, token, log_level)
@@ -0,0 +1,22 @@
+"""
+`wf-export status` command.
+
+This module defines the command that reports the installation status of WF Exporter.
+"""
+
+import sys
+
+import click
+
+
+@click.command()
+@click.option('--refresh', is_flag=True, help='Ignore the cached status and query the workspace')
+def status(refresh):
+    """Show installation status of WF Exporter components."""
+    from .install_cli import show_status
+    
+    try:
+        show_status(refresh=refresh)
+    except Exception as e:
+        click.echo(f"Failed to check status: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,35 @@
+"""
+`wf-export uninstall` command.
+
+This module defines the command that removes WF Exporter from a Databricks workspace.
+"""
+
+import sys
+
+import click
+
+
+@click.command()
+@click.option('--workflow', is_flag=True, help='Uninstall workflow only')
+@click.option('--app', is_flag=True, help='Uninstall app only')
+@click.option('--all', 'uninstall_all', is_flag=True, help='Uninstall all components')
+@click.confirmation_option(prompt='Are you sure you want to uninstall WF Exporter components?')
+def uninstall(workflow, app, uninstall_all):
+    """Uninstall WF Exporter components from Databricks workspace."""
+    from .install_cli import run_uninstall
+    
+    # If no specific flags are provided, default to uninstalling all components
+    if not (workflow or app or uninstall_all):
+        uninstall_all = True
+        workflow = True
+        app = True
+    
+    try:
+        run_uninstall(
+            uninstall_workflow=workflow or uninstall_all,
+            uninstall_app=app or uninstall_all,
+            uninstall_all=uninstall_all
+        )
+    except Exception as e:
+        click.echo(f"Uninstallation failed: {e}", err=True)
+        sys.exit(1)
@@ -5,17 +5,49 @@ This module provides centralized configuration loading and access,
 implementing the singleton pattern to ensure config is loaded only once.
 """
 
+import hashlib
+import logging
 import os
+import pickle
+import string
+import struct
+import tempfile
+import threading
 import yaml
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, TypedDict
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
 try:
-    import pkg_resources
+    from yaml import CSafeLoader as _SafeLoader
 except ImportError:
-    pkg_resources = None
+    from yaml import SafeLoader as _SafeLoader
 
 from ..logging.log_manager import LogManager
 
+# Parsed configs are cached next to other wfexporter state, headed by (size, mtime_ns)
+_CONFIG_CACHE_HEADER = struct.Struct("<Qq")
+
+
+class _SafeFmt(string.Formatter):
+    """Formatter that leaves unknown placeholders in path templates untouched."""
+    
+    def get_value(self, key, args, kwargs):
+        return kwargs.get(key, "{" + str(key) + "}")
+
+
+_FMT = _SafeFmt()
+
+
+class _Config(TypedDict, total=False):
+    """Top-level sections of config.yml."""
+    workflows: List[Dict[str, Any]]
+    pipelines: List[Dict[str, Any]]
+    global_settings: Dict[str, Any]
+    initial_variables: Dict[str, Any]
+    value_replacements: Dict[str, str]
+    spark_conf_key_replacements: List[Dict[str, Any]]
+    path_replacement: Dict[str, str]
+
 
 class ConfigManager:
     """
@@ -31,88 +63,315 @@ class ConfigManager:
     """
     
     _instance = None  # Singleton instance
+    _lock = threading.Lock()  # Serializes the first load so the YAML is parsed once
+    
+    __slots__ = (
+        "_logger", "config_path", "config_data",
+        "_workflow_by_id", "_pipeline_by_id", "_active_jobs", "_active_pipelines", "_global_export_libraries",
+        "_replacements", "_spark_transformations", "_path_replacements",
+        "_path_vars", "v_start_path", "v_resource_key_job_id_mapping_csv_file_path", "v_backup_jobs_yaml_path",
+        "v_databricks_cli_path", "v_databricks_config_profile", "v_log_directory_path", "v_databricks_yml_path",
+    )
     
     def __new__(cls, logger: Optional['LogManager'] = None, config_path: Optional[str] = None):
-        """Implements singleton pattern for configuration management."""
-        if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance._initialized = False
+        """
+        Implements singleton pattern for configuration management.
+        
+        The shared instance is reused unless a different config_path is requested,
+        in which case that file is loaded and replaces the shared instance.
+        """
+        if cls._needs_load(config_path):
+            with cls._lock:
+                # Re-check: another thread may have loaded the config while we waited
+                if cls._needs_load(config_path):
+                    previous = cls._instance
+                    if logger is None and previous is not None:
+                        logger = previous._logger
+                    instance = super(ConfigManager, cls).__new__(cls)
+                    instance._do_init(logger, config_path)
+                    cls._instance = instance
         return cls._instance
     
+    @classmethod
+    def _needs_load(cls, config_path: Optional[str]) -> bool:
+        """
+        Check whether config_path has to be loaded instead of reusing the shared instance.
+        
+        Args:
+            config_path: Requested config file, or None to accept whatever is loaded
+            
+        Returns:
+            True if nothing is loaded yet or a different config file was requested
+        """
+        instance = cls._instance
+        if instance is None:
+            return True
+        # Resolved on both sides, so relative/absolute/symlinked spellings of one file match
+        return bool(config_path) and os.path.realpath(config_path) != instance.config_path
+    
+    @classmethod
+    def get(cls, logger: Optional['LogManager'] = None, config_path: Optional[str] = None) -> 'ConfigManager':
+        """
+        Return the shared ConfigManager, loading the configuration on first use.
+        
+        Args:
+            logger: Logger used if the configuration still has to be loaded
+            config_path: Config file to use; a path other than the loaded one triggers a reload
+            
+        Returns:
+            The fully initialized ConfigManager instance
+        """
+        if not cls._needs_load(config_path):
+            return cls._instance
+        return cls(logger, config_path)
+    
     def __init__(self, logger: Optional['LogManager'] = None, config_path: Optional[str] = None):
+        """No-op; the shared instance is initialized once by __new__."""
+        return
+    
+    def _do_init(self, logger: Optional['LogManager'], config_path: Optional[str]) -> None:
         """Initialize the ConfigManager and load configuration."""
-        if getattr(self, '_initialized', False):
-            return
-            
-        self.logger = logger or LogManager()
+        self._logger = logger
         self.config_path = config_path
-        self.config_data = self._load_config()
-        self._initialized = True
+        # Store the resolved file so _needs_load can recognise other spellings of it
+        self.config_path = os.path.realpath(self._find_config_file())
+        self.config_data: _Config = self._load_config()
+        self._build_indexes()
+        self._resolve_initial_paths()
+    
+    @property
+    def logger(self) -> 'LogManager':
+        """Logger for configuration messages, created on first use if none was given."""
+        if self._logger is None:
+            self._logger = LogManager()
+        return self._logger
+    
+    @logger.setter
+    def logger(self, logger: 'LogManager') -> None:
+        self._logger = logger
     
     def _find_config_file(self) -> str:
         """
-        Find the config.yml file, checking multiple possible locations.
+        Find the config.yml file.
+        
+        An explicitly provided path is used as-is; otherwise config.yml in the
+        current working directory is used. Existence is checked by _load_config.
         
         Returns:
             Path to the configuration file
         """
         # If config_path is explicitly provided, use it
-        if self.config_path and os.path.exists(self.config_path):
+        if self.config_path:
             return self.config_path
         
-        # # List of possible config file locations
-        # possible_paths = [
-        #     # Current working directory
-        #     os.path.join(os.getcwd(), "config.yml"),
-        #     # Same directory as this script
-        #     os.path.join(os.path.dirname(__file__), "config.yml"),
-        #     # Parent directory (for module structure)
-        #     os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.yml"),
-        # ]
-        
-        # # Check file system paths first
-        # for path in possible_paths:
-        #     if path and os.path.exists(path):
-        #         self.logger.debug(f"Found config file at: {path}")
-        #         return path
-        
-        # # Try to load from package resources (for installed wheel)
-        # if pkg_resources:
-        #     try:
-        #         resource_path = pkg_resources.resource_filename('wfexporter', 'config.yml')
-        #         if os.path.exists(resource_path):
-        #             self.logger.debug(f"Found config file in package resources: {resource_path}")
-        #             return resource_path
-        #     except Exception:
-        #         pass
-        
-        # # If none found, use default path
-        # default_path = os.path.join(os.getcwd(), "config.yml")
-        # self.logger.warning(f"No config file found. Will attempt to use: {default_path}")
-        # return default_path
+        # # Package resources fallback (for installed wheel), if ever needed:
+        # try:
+        #     from importlib.resources import files
+        #     resource_path = str(files('wfExporter').joinpath('config.yml'))
+        #     if os.path.exists(resource_path):
+        #         self.logger.debug(f"Found config file in package resources: {resource_path}")
+        #         return resource_path
+        # except Exception:
+        #     pass
+        
+        return os.path.join(os.getcwd(), "config.yml")
     
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> _Config:
         """
         Load configuration from config.yml file.
         
         Returns:
             Dictionary containing configuration data
+            
+        Raises:
+            FileNotFoundError: If the configuration file does not exist
         """
+        config_file_path = self._find_config_file()
         try:
-            config_file_path = self._find_config_file()
-            
-            if os.path.exists(config_file_path):
-                with open(config_file_path, "r") as config_file:
-                    config_data = yaml.safe_load(config_file)
-                    self.logger.debug(f"Configuration loaded successfully from: {config_file_path}")
-                    return config_data
-            else:
-                self.logger.error(f"Config file not found: {config_file_path}")
-                return {}
-                
+            stat = os.stat(config_file_path)
+        except FileNotFoundError:
+            self.logger.error(f"Config file not found: {config_file_path}")
+            raise FileNotFoundError(f"Config file not found: {config_file_path}") from None
+        
+        # The cache is only an optimization: any failure falls back to parsing the YAML
+        try:
+            cache_path = self._config_cache_path(config_file_path)
+        except Exception as e:
+            self.logger.debug(f"Config cache unavailable: {e}")
+            cache_path = None
+        
+        if cache_path:
+            config_data = self._read_cached_config(cache_path, stat)
+            if config_data is not None:
+                self.logger.debug(f"Configuration loaded from cache for: {config_file_path}")
+                return config_data
+        
+        try:
+            with open(config_file_path, "rb") as config_file:
+                config_data = yaml.load(config_file, Loader=_SafeLoader)
+                self.logger.debug(f"Configuration loaded successfully from: {config_file_path}")
         except Exception as e:
             self.logger.error(f"Error loading configuration: {str(e)}")
             return {}
+        
+        if cache_path:
+            self._write_cached_config(cache_path, stat, config_data)
+        return config_data
+    
+    def _build_indexes(self) -> None:
+        """
+        Precompute workflow/pipeline lookups so per-asset accessors avoid rescanning the config.
+        """
+        config_data = self.config_data or {}
+        workflows = config_data.get("workflows", None) or []
+        pipelines = config_data.get("pipelines", None) or []
+        
+        # First entry wins for duplicate IDs, matching the previous linear scans
+        self._workflow_by_id: Dict[str, Dict[str, Any]] = {}
+        for wf in workflows:
+            self._workflow_by_id.setdefault(str(wf.get('job_id', '')), wf)
+        self._pipeline_by_id: Dict[str, Dict[str, Any]] = {}
+        for pipeline in pipelines:
+            self._pipeline_by_id.setdefault(str(pipeline.get('pipeline_id', '')), pipeline)
+        
+        self._active_jobs: List[Tuple[str, str]] = [
+            (wf.get('job_id', ''), "Existing" if wf.get('is_existing') is True else "New")
+            for wf in workflows if wf.get('is_active') is True
+        ]
+        self._active_pipelines: List[Tuple[str, str]] = [
+            (pipeline.get('pipeline_id', ''), "Existing" if pipeline.get('is_existing') is True else "New")
+            for pipeline in pipelines if pipeline.get('is_active') is True
+        ]
+        
+        global_settings = config_data.get("global_settings", None) or {}
+        self._global_export_libraries = global_settings.get("export_libraries", True)
+        
+        self._replacements: Dict[str, str] = config_data.get("value_replacements", None) or {}
+        self._spark_transformations: List[Dict[str, Any]] = config_data.get("spark_conf_key_replacements", None) or []
+        self._path_replacements: Dict[str, str] = config_data.get("path_replacement", None) or {}
+    
+    def _resolve_initial_paths(self) -> None:
+        """
+        Format the initial_variables paths once, since they never change after loading.
+        """
+        initial_variables = (self.config_data or {}).get("initial_variables", None) or {}
+        
+        self.v_start_path = initial_variables.get("v_start_path", "../Project_ATT_Databricks_Workflows")
+        self._path_vars = {"v_start_path": self.v_start_path}
+        self.v_resource_key_job_id_mapping_csv_file_path = _FMT.vformat(initial_variables.get(
+            "v_resource_key_job_id_mapping_csv_file_path", 
+            "{v_start_path}/bind_scripts/resource_key_job_id_mapping.csv"
+        ), (), self._path_vars)
+        self.v_backup_jobs_yaml_path = _FMT.vformat(initial_variables.get(
+            "v_backup_jobs_yaml_path", 
+            "{v_start_path}/backup_jobs_yaml/"
+        ), (), self._path_vars)
+        self.v_databricks_cli_path = initial_variables.get("v_databricks_cli_path", None)  # None for auto-detection
+        self.v_databricks_config_profile = initial_variables.get("v_databricks_config_profile", None)  # None for env-based auth
+        
+        # Log and databricks.yml paths resolve a missing v_start_path against the working directory
+        cwd_path_vars = {"v_start_path": initial_variables.get("v_start_path", os.getcwd())}
+        self.v_log_directory_path = _FMT.vformat(initial_variables.get(
+            "v_log_directory_path", 
+            "run_logs"  # Default to root run_logs for backward compatibility
+        ), (), cwd_path_vars)
+        self.v_databricks_yml_path = _FMT.vformat(initial_variables.get(
+            "v_databricks_yml_path", 
+            "{v_start_path}/databricks.yml"
+        ), (), cwd_path_vars)
+    
+    @staticmethod
+    def _config_cache_path(config_file_path: str) -> str:
+        """
+        Location of the parsed-config cache for a config file.
+        
+        Args:
+            config_file_path: Path to the configuration file
+            
+        Returns:
+            Path to the pickle cache file
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        # Only a file name, not a security digest (usedforsecurity keeps FIPS builds working)
+        digest = hashlib.md5(os.path.abspath(config_file_path).encode(), usedforsecurity=False).hexdigest()
+        return os.path.join(cache_home, 'wfexporter', f"config-{digest}.pkl")
+    
+    @staticmethod
+    def _is_private(st: os.stat_result) -> bool:
+        """
+        Check that a cache file or directory belongs to the current user and only they can write it.
+        
+        Args:
+            st: Stat of the cache file or directory
+            
+        Returns:
+            True if the entry can be trusted (always True where ownership is not available)
+        """
+        if not hasattr(os, 'getuid'):
+            return True
+        return st.st_uid == os.getuid() and not st.st_mode & 0o022
+    
+    def _read_cached_config(self, cache_path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached parse of the config file if it is still current.
+        
+        Caches in directories or files owned or writable by other users are ignored,
+        since unpickling them could run arbitrary code.
+        
+        Args:
+            cache_path: Path to the pickle cache file
+            stat: Current stat of the configuration file
+            
+        Returns:
+            The cached configuration data, or None on a miss
+        """
+        try:
+            if not self._is_private(os.stat(os.path.dirname(cache_path))):
+                self.logger.debug(f"Ignoring config cache in a directory not private to this user: {cache_path}")
+                return None
+            with open(cache_path, "rb") as cache_file:
+                if not self._is_private(os.fstat(cache_file.fileno())):
+                    self.logger.debug(f"Ignoring config cache not private to this user: {cache_path}")
+                    return None
+                header = cache_file.read(_CONFIG_CACHE_HEADER.size)
+                if header != _CONFIG_CACHE_HEADER.pack(stat.st_size, stat.st_mtime_ns):
+                    return None
+                return pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+            return None
+    
+    def _write_cached_config(self, cache_path: str, stat: os.stat_result, config_data: Any) -> None:
+        """
+        Cache a parsed config so later runs can skip YAML parsing.
+        
+        Args:
+            cache_path: Path to the pickle cache file
+            stat: Stat of the configuration file that was parsed
+            config_data: Parsed configuration data
+        """
+        if config_data is None:
+            return
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            if not self._is_private(os.stat(cache_dir)):
+                self.logger.debug(f"Not caching configuration in a directory not private to this user: {cache_dir}")
+                return
+            payload = _CONFIG_CACHE_HEADER.pack(stat.st_size, stat.st_mtime_ns) + pickle.dumps(config_data, protocol=5)
+            # Write to a sibling temp file and swap it in so readers never see a partial cache
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(payload)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.debug(f"Could not cache configuration: {e}")
     
     def get_active_jobs(self) -> List[Tuple[str, str]]:
         """
@@ -121,15 +380,9 @@ class ConfigManager:
         Returns:
             List of tuples containing (job_id, status) for active jobs
         """
-        workflows_details = self.config_data.get("workflows", [])
-        
-        active_jobs = []
-        for wf in workflows_details:
-            if wf.get('is_active', '') == True:
-                is_existing = "Existing" if wf.get('is_existing', '') == True else "New"
-                active_jobs.append((wf.get('job_id', ''), is_existing))
-        
-        self.logger.debug(f"Found {len(active_jobs)} active jobs in configuration")
+        active_jobs = list(self._active_jobs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Found {len(active_jobs)} active jobs in configuration")
         return active_jobs
     
     def get_global_export_libraries_flag(self) -> bool:
@@ -139,9 +392,9 @@ class ConfigManager:
         Returns:
             bool: Global export_libraries setting (default: True)
         """
-        global_settings = self.config_data.get("global_settings", {})
-        export_libraries = global_settings.get("export_libraries", True)
-        self.logger.debug(f"Global export_libraries flag: {export_libraries}")
+        export_libraries = self._global_export_libraries
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Global export_libraries flag: {export_libraries}")
         return export_libraries
     
     def get_workflow_export_libraries_flag(self, job_id: str) -> bool:
@@ -154,24 +407,26 @@ class ConfigManager:
         Returns:
             bool: Effective export_libraries setting for this workflow
         """
-        # Get global setting first
         global_flag = self.get_global_export_libraries_flag()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         
         # If global flag is False, it overrides all individual settings
         if not global_flag:
-            self.logger.debug(f"Global export_libraries is False, overriding workflow {job_id} setting")
+            if debug:
+                self.logger.debug(f"Global export_libraries is False, overriding workflow {job_id} setting")
             return False
         
-        # Check workflow-specific setting
-        workflows_details = self.config_data.get("workflows", [])
-        for wf in workflows_details:
-            if str(wf.get('job_id', '')) == str(job_id):
-                workflow_flag = wf.get('export_libraries', True)  # Default to True if not specified
+        # Check workflow-specific setting, defaulting to True if not specified
+        entry = self._workflow_by_id.get(str(job_id))
+        if entry is not None:
+            workflow_flag = entry.get('export_libraries', True)
+            if debug:
                 self.logger.debug(f"Workflow {job_id} export_libraries flag: {workflow_flag}")
-                return workflow_flag
+            return workflow_flag
         
         # Default to global setting if workflow not found
-        self.logger.debug(f"Workflow {job_id} not found, using global setting: {global_flag}")
+        if debug:
+            self.logger.debug(f"Workflow {job_id} not found, using global setting: {global_flag}")
         return global_flag
     
     def get_active_pipelines(self) -> List[Tuple[str, str]]:
@@ -181,15 +436,9 @@ class ConfigManager:
         Returns:
             List of tuples containing (pipeline_id, status) for active pipelines
         """
-        pipelines_details = self.config_data.get("pipelines", [])
-        
-        active_pipelines = []
-        for pipeline in pipelines_details:
-            if pipeline.get('is_active', '') == True:
-                is_existing = "Existing" if pipeline.get('is_existing', '') == True else "New"
-                active_pipelines.append((pipeline.get('pipeline_id', ''), is_existing))
-        
-        self.logger.debug(f"Found {len(active_pipelines)} active pipelines in configuration")
+        active_pipelines = list(self._active_pipelines)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Found {len(active_pipelines)} active pipelines in configuration")
         return active_pipelines
     
     def get_pipeline_export_libraries_flag(self, pipeline_id: str) -> bool:
@@ -202,24 +451,26 @@ class ConfigManager:
         Returns:
             bool: Effective export_libraries setting for this pipeline
         """
-        # Get global setting first
         global_flag = self.get_global_export_libraries_flag()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         
         # If global flag is False, it overrides all individual settings
         if not global_flag:
-            self.logger.debug(f"Global export_libraries is False, overriding pipeline {pipeline_id} setting")
+            if debug:
+                self.logger.debug(f"Global export_libraries is False, overriding pipeline {pipeline_id} setting")
             return False
         
-        # Check pipeline-specific setting
-        pipelines_details = self.config_data.get("pipelines", [])
-        for pipeline in pipelines_details:
-            if str(pipeline.get('pipeline_id', '')) == str(pipeline_id):
-                pipeline_flag = pipeline.get('export_libraries', True)  # Default to True if not specified
+        # Check pipeline-specific setting, defaulting to True if not specified
+        entry = self._pipeline_by_id.get(str(pipeline_id))
+        if entry is not None:
+            pipeline_flag = entry.get('export_libraries', True)
+            if debug:
                 self.logger.debug(f"Pipeline {pipeline_id} export_libraries flag: {pipeline_flag}")
-                return pipeline_flag
+            return pipeline_flag
         
         # Default to global setting if pipeline not found
-        self.logger.debug(f"Pipeline {pipeline_id} not found, using global setting: {global_flag}")
+        if debug:
+            self.logger.debug(f"Pipeline {pipeline_id} not found, using global setting: {global_flag}")
         return global_flag
     
     def get_initial_paths(self) -> Tuple[str, str, str, str, str]:
@@ -230,21 +481,8 @@ class ConfigManager:
             Tuple containing start_path, resource_key_job_id_mapping_csv_file_path, 
             backup_jobs_yaml_path, cli_path, and config_profile
         """
-        initial_variables = self.config_data.get("initial_variables", {})
-        
-        v_start_path = initial_variables.get("v_start_path", "../Project_ATT_Databricks_Workflows")
-        v_resource_key_job_id_mapping_csv_file_path = initial_variables.get(
-            "v_resource_key_job_id_mapping_csv_file_path", 
-            "{v_start_path}/bind_scripts/resource_key_job_id_mapping.csv"
-        ).format(v_start_path=v_start_path)
-        v_backup_jobs_yaml_path = initial_variables.get(
-            "v_backup_jobs_yaml_path", 
-            "{v_start_path}/backup_jobs_yaml/"
-        ).format(v_start_path=v_start_path)
-        v_databricks_cli_path = initial_variables.get("v_databricks_cli_path", None)  # None for auto-detection
-        v_databricks_config_profile = initial_variables.get("v_databricks_config_profile", None)  # None for env-based auth
-        
-        return v_start_path, v_resource_key_job_id_mapping_csv_file_path, v_backup_jobs_yaml_path, v_databricks_cli_path, v_databricks_config_profile
+        return (self.v_start_path, self.v_resource_key_job_id_mapping_csv_file_path, self.v_backup_jobs_yaml_path,
+                self.v_databricks_cli_path, self.v_databricks_config_profile)
     
     def get_log_directory_path(self) -> str:
         """
@@ -253,19 +491,7 @@ class ConfigManager:
         Returns:
             str: Path to the log directory
         """
-        initial_variables = self.config_data.get("initial_variables", {})
-        v_start_path = initial_variables.get("v_start_path", os.getcwd())
-        
-        v_log_directory_path = initial_variables.get(
-            "v_log_directory_path", 
-            "run_logs"  # Default to root run_logs for backward compatibility
-        )
-        
-        # If the path contains placeholders, format it
-        if "{v_start_path}" in v_log_directory_path:
-            v_log_directory_path = v_log_directory_path.format(v_start_path=v_start_path)
-        
-        return v_log_directory_path
+        return self.v_log_directory_path
     
     def get_databricks_yml_path(self) -> str:
         """
@@ -274,15 +500,7 @@ class ConfigManager:
         Returns:
             str: Path to the databricks.yml file
         """
-        initial_variables = self.config_data.get("initial_variables", {})
-        v_start_path = initial_variables.get("v_start_path", os.getcwd())
-        
-        v_databricks_yml_path = initial_variables.get(
-            "v_databricks_yml_path", 
-            "{v_start_path}/databricks.yml"
-        ).format(v_start_path=v_start_path)
-        
-        return v_databricks_yml_path
+        return self.v_databricks_yml_path
     
     def get_replacements(self) -> Dict[str, str]:
         """
@@ -291,8 +509,9 @@ class ConfigManager:
         Returns:
             Dictionary of value replacements to apply to YAML files
         """
-        replacements = self.config_data.get("value_replacements", {})
-        self.logger.debug(f"Loaded {len(replacements)} value replacements from configuration")
+        replacements = self._replacements
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Loaded {len(replacements)} value replacements from configuration")
         return replacements
     
     def get_spark_conf_transformations(self) -> List[Dict[str, Any]]:
@@ -302,8 +521,9 @@ class ConfigManager:
         Returns:
             List of dictionaries containing spark configuration transformation rules
         """
-        transformations = self.config_data.get("spark_conf_key_replacements", [])
-        self.logger.debug(f"Loaded {len(transformations)} spark configuration transformations from configuration")
+        transformations = self._spark_transformations
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Loaded {len(transformations)} spark configuration transformations from configuration")
         return transformations
     
     def get_path_replacements(self) -> Dict[str, str]:
@@ -313,6 +533,7 @@ class ConfigManager:
         Returns:
             Dictionary of path replacement patterns
         """
-        replacements = self.config_data.get("path_replacement", {})
-        self.logger.debug(f"Loaded {len(replacements)} path replacement patterns from configuration")
+        replacements = self._path_replacements
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Loaded {len(replacements)} path replacement patterns from configuration")
         return replacements 
\ No newline at end of file
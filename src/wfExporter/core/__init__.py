@@ -5,6 +5,42 @@ This module contains the main DatabricksExporter class that orchestrates
 the entire workflow export process using the Facade pattern.
 """
 
-from .databricks_exporter import DatabricksExporter
+import importlib.util
+import sys
 
-__all__ = ['DatabricksExporter'] 
\ No newline at end of file
+
+def _lazy_module(name: str):
+    """
+    Register a module whose body only executes on first attribute access.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The (possibly not yet executed) module object
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# The exporter pulls in the Databricks SDK and the processing chain; defer it
+# until DatabricksExporter (or another module attribute) is actually used.
+databricks_exporter = _lazy_module(f"{__name__}.databricks_exporter")
+
+
+def __getattr__(name):
+    """Resolve DatabricksExporter from the lazily loaded module."""
+    if name == 'DatabricksExporter':
+        return databricks_exporter.DatabricksExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['DatabricksExporter']
@@ -7,10 +7,8 @@ workflow export process using the Facade pattern. Supports both job and DLT pipe
 
 import os
 import shutil
-import logging
 from typing import Optional, Tuple, List, Dict, Any
 
-import pandas as pd
 import yaml
 
 from ..logging.log_manager import LogManager
@@ -20,6 +18,14 @@ from ..processing.yaml_serializer import YamlSerializer
 from ..processing.export_file_handler import ExportFileHandler
 from ..config.config_manager import ConfigManager
 
+# RuntimeError messages for each DatabricksCliManager.ensure_ready() failed_step
+_SETUP_FAILURE_MESSAGES = {
+    'install': "Failed to install or locate Databricks CLI",
+    'verify': "Failed to verify Databricks CLI installation",
+    'auth_setup': "Failed to set up Databricks authentication",
+    'auth_test': "Failed to authenticate with Databricks",
+}
+
 
 class DatabricksExporter:
     """
@@ -50,17 +56,16 @@ class DatabricksExporter:
             databricks_token: Databricks access token (optional)
             log_level: Override log level from CLI (optional)
         """
-        # Create temporary logger without file handler for config loading
-        temp_logger = LogManager(create_file_handler=False, override_log_level=log_level)
+        # Create the main logger; its file handler needs the config, so it is added after loading
+        self.logger = LogManager(create_file_handler=False, override_log_level=log_level)
         
-        # Load configuration with temporary logger
-        self.config_manager = ConfigManager(logger=temp_logger, config_path=config_path)
+        # Load configuration (reused if this config file is already loaded)
+        self.config_manager = ConfigManager.get(logger=self.logger, config_path=config_path)
         
-        # Set up proper logging with config data (this is the main logger)
-        self.logger = LogManager(config_data=self.config_manager.config_data, 
-                                override_log_level=log_level)
+        # Apply the configured log level and log directory to the main logger
+        self.logger.apply_config(self.config_manager.config_data)
         
-        # Update config manager to use the proper logger
+        # Make sure a reused config manager logs through this logger
         self.config_manager.logger = self.logger
         
         # Get CLI and profile configuration
@@ -76,6 +81,9 @@ class DatabricksExporter:
         self.databricks_host = databricks_host
         self.databricks_token = databricks_token
         
+        # Directories already created during this run, so repeated jobs skip the syscalls
+        self._dirs_ensured = set()
+        
         # Set Pandas display options
         self.logger.debug("DatabricksExporter initialized successfully")
         
@@ -88,21 +96,10 @@ class DatabricksExporter:
         """
         self.logger.debug("Setting up Databricks CLI configuration...")
         
-        # Install or locate CLI based on environment
-        if not self.cli_manager.install_cli():
-            raise RuntimeError("Failed to install or locate Databricks CLI")
-        
-        # Verify CLI installation
-        if not self.cli_manager.verify_installation():
-            raise RuntimeError("Failed to verify Databricks CLI installation")
-        
-        # Set up authentication
-        if not self.cli_manager.setup_authentication(self.databricks_host, self.databricks_token):
-            raise RuntimeError("Failed to set up Databricks authentication")
-        
-        # Test authentication
-        if not self.cli_manager.test_authentication():
-            raise RuntimeError("Failed to authenticate with Databricks")
+        # Install or locate, verify and authenticate the CLI in one pass
+        if not self.cli_manager.ensure_ready(self.databricks_host, self.databricks_token):
+            raise RuntimeError(_SETUP_FAILURE_MESSAGES.get(
+                self.cli_manager.failed_step, "Failed to set up Databricks CLI"))
         
         self.logger.debug("Databricks CLI setup completed successfully")
     
@@ -148,33 +145,37 @@ class DatabricksExporter:
         self.logger.debug(f"Discovered {len(discovered_files)} generated files for {asset_type}: {asset_name}")
         return discovered_files
 
-    def _clean_existing_files(self, start_path: str, job_name: str, backup: bool = True) -> Optional[str]:
+    def _clean_existing_files(self, start_path: str, job_resource_name: str, backup: bool = True) -> Optional[str]:
         """
         Clean up existing job files before generating new ones.
         
         Args:
             start_path: The base path for file operations
-            job_name: The name of the job (for file naming)
+            job_resource_name: The job name as converted by convert_string (for file naming)
             backup: If True, renames existing YAML to .bak. If False, deletes the backup.
             
         Returns:
             The path to the backup file if created, otherwise None.
         """
         try:
-            yaml_file = os.path.join(start_path, 'resources', f"{self.file_manager.convert_string(job_name)}.job.yml")
+            yaml_file = os.path.join(start_path, 'resources', f"{job_resource_name}.job.yml")
             backup_file = f"{yaml_file}.bak"
             
             if backup:
                 # Rename the existing YAML to a backup file
-                if os.path.exists(yaml_file):
+                try:
                     os.rename(yaml_file, backup_file)
-                    self.logger.debug(f"Backed up existing job YAML file to: {backup_file}")
-                    return backup_file
+                except FileNotFoundError:
+                    return None
+                self.logger.debug(f"Backed up existing job YAML file to: {backup_file}")
+                return backup_file
             else:
                 # Delete the backup file after a successful run
-                if os.path.exists(backup_file):
+                try:
                     os.remove(backup_file)
                     self.logger.debug(f"Removed job YAML backup file: {backup_file}")
+                except FileNotFoundError:
+                    pass
             
         except Exception as e:
             self.logger.error(f"Error during job file cleanup/backup: {e}")
@@ -198,9 +199,11 @@ class DatabricksExporter:
             
             if backup:
                 # Rename the existing YAML to a backup file
-                if os.path.exists(yaml_file):
+                try:
                     os.rename(yaml_file, backup_file)
                     self.logger.debug(f"Backed up existing pipeline YAML file to: {backup_file}")
+                except FileNotFoundError:
+                    pass
                 
                 # Also clean up any existing src/ files related to this pipeline
                 src_directory = os.path.join(start_path, 'src')
@@ -223,14 +226,29 @@ class DatabricksExporter:
                 return backup_file
             else:
                 # Delete the backup file after a successful run
-                if os.path.exists(backup_file):
+                try:
                     os.remove(backup_file)
                     self.logger.debug(f"Removed pipeline YAML backup file: {backup_file}")
+                except FileNotFoundError:
+                    pass
             
         except Exception as e:
             self.logger.error(f"Error during pipeline file cleanup/backup: {e}")
         return None
 
+    def _ensure_directory(self, path: str) -> None:
+        """
+        Create a directory (and parents) once per run.
+        
+        Args:
+            path: Directory that must exist
+        """
+        if path in self._dirs_ensured:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._dirs_ensured.add(path)
+        self.logger.debug(f"Ensured directory exists: {path}")
+    
     def _restore_backup_file(self, backup_file: Optional[str]):
         """Restores a backup file if it exists."""
         if backup_file and os.path.exists(backup_file):
@@ -516,23 +534,50 @@ class DatabricksExporter:
         
         return artifacts
     
-    def _prepare_file_mapping(self, df: pd.DataFrame, job_id: str, file_paths: List[str], start_path: str) -> pd.DataFrame:
+    def _select_notebook_tasks(self, workflow_definition: List[dict], job_id: str) -> List[dict]:
         """
-        Prepare file mapping DataFrame.
+        Select the distinct notebook tasks of a job in a single pass.
         
         Args:
-            df: DataFrame containing workflow task information
+            workflow_definition: List of task dictionaries for the job
+            job_id: The job ID whose tasks should be kept
+            
+        Returns:
+            Tasks of job_id with a notebook path, without exact duplicates, in their original order
+        """
+        job_id = int(job_id)
+        seen = set()
+        notebook_tasks = []
+        for task in workflow_definition:
+            # Cheap filters first so only candidate rows are hashed for deduplication
+            if task.get('Notebook_Path') is None or int(task['JobId']) != job_id:
+                continue
+            # JobId is compared as an int; lists (e.g. Libraries) by their string form to keep the key hashable
+            key = tuple((k, job_id if k == 'JobId' else str(v) if isinstance(v, (list, dict)) else v)
+                        for k, v in task.items())
+            if key not in seen:
+                seen.add(key)
+                notebook_tasks.append(task)
+        return notebook_tasks
+    
+    def _prepare_file_mapping(self, notebook_tasks: List[dict], job_id: str, file_paths: List[str], 
+                              start_path: str) -> List[Dict[str, Any]]:
+        """
+        Prepare the file mapping for a job's notebook tasks.
+        
+        Args:
+            notebook_tasks: Notebook tasks of the job, as returned by _select_notebook_tasks
             job_id: The job ID
             file_paths: List of generated file paths
             start_path: The base path for file operations
-            start_path: The base path for file operations
             
         Returns:
-            DataFrame with file mapping information
+            List of task dictionaries extended with exported_file_path, src_directory
+            and dest_directory entries
         """
         try:
             self.logger.debug(f"_prepare_file_mapping called with job_id: {job_id}")
-            self.logger.debug(f"Input DataFrame shape: {df.shape}")
+            self.logger.debug(f"Input task count: {len(notebook_tasks)}")
             self.logger.debug(f"file_paths: {file_paths}")
             
             notebook_files = [f for f in file_paths if not f.endswith('.yml')]
@@ -541,76 +586,49 @@ class DatabricksExporter:
             file_map = {os.path.splitext(os.path.basename(f))[0]: f for f in notebook_files}
             self.logger.debug(f"file_map: {file_map}")
 
-            filtered_df = df[df['JobId'] == int(job_id)].copy()
-            self.logger.debug(f"Filtered DataFrame shape: {filtered_df.shape}")
-
-            # Helper function to find the absolute path of the exported file
-            def get_exported_path(notebook_path):
-                if notebook_path is None:
-                    return None
+            file_mapping = []
+            dropped = 0
+            for task in notebook_tasks:
+                notebook_path = task['Notebook_Path']
+                
+                # Absolute path of the exported file; skip tasks whose file was not generated
                 base_name = os.path.splitext(os.path.basename(notebook_path))[0]
-                result = file_map.get(base_name)
-                self.logger.debug(f"get_exported_path({notebook_path}) -> base_name: {base_name}, result: {result}")
-                return result
-
-            self.logger.debug("Applying get_exported_path function...")
-            filtered_df['exported_file_path'] = filtered_df['Notebook_Path'].apply(get_exported_path)
-            
-            # Drop rows where no matching file was found
-            self.logger.debug("Dropping rows with null exported_file_path...")
-            filtered_df.dropna(subset=['exported_file_path'], inplace=True)
-            self.logger.debug(f"After dropping nulls, DataFrame shape: {filtered_df.shape}")
-
-            # src_directory: The relative path that `bundle generate` writes to the YAML file.
-            # This is the key for our replacement map.
-            self.logger.debug("Creating src_directory column...")
-            filtered_df['src_directory'] = filtered_df['exported_file_path'].apply(
-                lambda x: f"../src/{os.path.basename(x)}" if x else None
-            )
-            
-            # dest_directory: The final, transformed path where the file should be moved.
-            # This is the value for our replacement map.
-            self.logger.debug("Creating dest_directory column...")
-            def create_dest_directory(row):
+                exported_file_path = file_map.get(base_name)
+                self.logger.debug(f"get_exported_path({notebook_path}) -> base_name: {base_name}, result: {exported_file_path}")
+                if not exported_file_path:
+                    continue
+                
+                # dest_directory: The final, transformed path where the file should be moved.
+                # This is the value for our replacement map.
                 try:
-                    if row['Notebook_Path'] is None or row['exported_file_path'] is None:
-                        return None
-                    
-                    file_dict = {os.path.splitext(os.path.basename(row['Notebook_Path']))[0]: os.path.basename(row['exported_file_path'])}
-                    result = self.file_manager.transform_notebook_path(row['Notebook_Path'], file_dict)
-                    self.logger.debug(f"transform_notebook_path({row['Notebook_Path']}, {file_dict}) -> {result}")
-                    return result
+                    file_dict = {base_name: os.path.basename(exported_file_path)}
+                    dest_directory = self.file_manager.transform_notebook_path(notebook_path, file_dict)
+                    self.logger.debug(f"transform_notebook_path({notebook_path}, {file_dict}) -> {dest_directory}")
                 except Exception as e:
-                    self.logger.error(f"Error in create_dest_directory for row: {row}, error: {e}")
-                    return None
-            
-            filtered_df['dest_directory'] = filtered_df.apply(create_dest_directory, axis=1)
-
-            # Drop any rows where dest_directory couldn't be created
-            initial_count = len(filtered_df)
-            filtered_df.dropna(subset=['dest_directory'], inplace=True)
-            final_count = len(filtered_df)
-            
-            if initial_count != final_count:
-                self.logger.warning(f"Dropped {initial_count - final_count} rows due to null dest_directory")
+                    self.logger.error(f"Error in create_dest_directory for task: {task}, error: {e}")
+                    dest_directory = None
+                if dest_directory is None:
+                    dropped += 1
+                    continue
+                
+                file_mapping.append({
+                    **task,
+                    'exported_file_path': exported_file_path,
+                    # src_directory: The relative path that `bundle generate` writes to the YAML file.
+                    # This is the key for our replacement map.
+                    'src_directory': f"../src/{os.path.basename(exported_file_path)}",
+                    'dest_directory': dest_directory,
+                })
+            
+            if dropped:
+                self.logger.warning(f"Dropped {dropped} rows due to null dest_directory")
 
-            self.logger.debug(f"Prepared file mapping for {len(filtered_df)} files")
-            self.logger.debug(f"Final DataFrame columns: {filtered_df.columns.tolist()}")
-            
-            # Check for any list values in key columns
-            for col in ['src_directory', 'dest_directory']:
-                if col in filtered_df.columns:
-                    for idx, val in enumerate(filtered_df[col]):
-                        if isinstance(val, list):
-                            self.logger.error(f"Found list value in {col} at index {idx}: {val}")
-                        elif not isinstance(val, str):
-                            self.logger.warning(f"Non-string value in {col} at index {idx}: {val} (type: {type(val)})")
-            
-            return filtered_df
+            self.logger.debug(f"Prepared file mapping for {len(file_mapping)} files")
+            return file_mapping
             
         except Exception as e:
             self.logger.error(f"Error in _prepare_file_mapping: {e}")
-            self.logger.debug(f"Input df:\n{df}")
+            self.logger.debug(f"Input tasks: {notebook_tasks}")
             raise
     
     def _validate_folder_structure(self, start_path: str, asset_name: str, asset_type: str) -> bool:
@@ -696,8 +714,42 @@ class DatabricksExporter:
         except Exception as e:
             self.logger.error(f"Error generating processing summary: {str(e)}")
     
+    def _prefetch_workflow_definitions(self, job_ids: List[str],
+                                       max_workers: Optional[int] = None) -> Dict[str, List[dict]]:
+        """
+        Fetch the workflow task definitions of several jobs concurrently.
+        
+        Only the read-only Jobs API calls run in parallel: every job's bundle generate,
+        file moves and src/ cleanup share start_path, so process_job itself stays sequential.
+        
+        Args:
+            job_ids: The Databricks job IDs to fetch
+            max_workers: Maximum number of concurrent API calls (default: min(32, 4 * CPUs))
+            
+        Returns:
+            Dictionary mapping job_id to its workflow definition; jobs whose fetch failed
+            are omitted so that process_job retries and reports them
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if len(job_ids) < 2:
+            return {}
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        
+        definitions = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(job_ids))) as executor:
+            futures = {job_id: executor.submit(self.workflow_manager.get_job_workflow_tasks, job_id)
+                       for job_id in job_ids}
+            for job_id, future in futures.items():
+                try:
+                    definitions[job_id] = future.result()
+                except Exception as e:
+                    self.logger.debug(f"Prefetching workflow definition for job {job_id} failed: {e}")
+        return definitions
+    
     def process_job(self, job_id: str, start_path: str, backup_yaml_path: str,
-                   job_status: str) -> Tuple[bool, Optional[Tuple[str, str]]]:
+                   job_status: str, workflow_definition: Optional[List[dict]] = None) -> Tuple[bool, Optional[Tuple[str, str]]]:
         """
         Process a single job - generate YAML, move files, update YAML.
         
@@ -706,6 +758,7 @@ class DatabricksExporter:
             start_path: The base path for file operations
             backup_yaml_path: Path for YAML backups
             job_status: Status of the job ('Existing' or 'New')
+            workflow_definition: Already fetched workflow tasks for the job (optional)
             
         Returns:
             Tuple of (success, resource_mapping) where resource_mapping is optional
@@ -714,21 +767,22 @@ class DatabricksExporter:
             self.logger.info(f"Starting job processing for job ID: {job_id}")
 
             # Get workflow definition and job details (now includes all task types)
-            # Get workflow definition and job details (now includes all task types)
-            workflow_definition = self.workflow_manager.get_job_workflow_tasks(job_id)
+            if workflow_definition is None:
+                workflow_definition = self.workflow_manager.get_job_workflow_tasks(job_id)
             
             if not workflow_definition:
                 self.logger.error(f"No workflow definition found for job ID: {job_id}")
                 return False, None
 
             job_name = workflow_definition[0]['Job_Name']
+            job_resource_name = self.file_manager.convert_string(job_name)
             
             # Log job details
             self.logger.debug(f"Processing job id: {job_id}, job name: {job_name}")
             self.logger.debug(f"Workflow definition contains {len(workflow_definition)} tasks")
             
             # Backup existing files
-            backup_file = self._clean_existing_files(start_path, job_name, backup=True)
+            backup_file = self._clean_existing_files(start_path, job_resource_name, backup=True)
             
             # Generate YAML and source files using bundle generate (for notebooks only)
             # Generate YAML and source files using bundle generate (for notebooks only)
@@ -741,7 +795,7 @@ class DatabricksExporter:
                 return False, None
             
             # Clean up the backup file after a successful run
-            self._clean_existing_files(start_path, job_name, backup=False)
+            self._clean_existing_files(start_path, job_resource_name, backup=False)
             
             # Discover generated files from the filesystem (notebooks from bundle generate)
             file_paths = self._discover_generated_files(start_path, job_name, 'job')
@@ -808,87 +862,34 @@ class DatabricksExporter:
                 self.logger.debug("No additional artifacts to download")
                 download_results = []
             
-            # Convert workflow to DataFrame for notebook processing (backward compatibility)
+            # Select distinct notebook tasks for the existing file mapping logic
             try:
-                self.logger.debug("Converting workflow definition to DataFrame...")
-                self.logger.debug(f"workflow_definition sample: {workflow_definition[:2] if len(workflow_definition) > 0 else 'empty'}")
-                
-                # Convert lists to strings to avoid "unhashable type: 'list'" error in drop_duplicates()
-                workflow_definition_processed = []
-                for task in workflow_definition:
-                    task_copy = task.copy()
-                    # Convert Libraries list to string representation for pandas operations
-                    if 'Libraries' in task_copy and isinstance(task_copy['Libraries'], list):
-                        task_copy['Libraries'] = str(task_copy['Libraries'])
-                    workflow_definition_processed.append(task_copy)
-                
-                df = pd.DataFrame(workflow_definition_processed)
-                self.logger.debug(f"DataFrame columns: {df.columns.tolist()}")
-                self.logger.debug(f"DataFrame shape: {df.shape}")
-                
-                df['JobId'] = df['JobId'].astype('int64')
-                df = df.drop_duplicates()
-                
-                # Filter for notebook tasks only for the existing file mapping logic
-                notebook_df = df[df['Notebook_Path'].notnull()]
-                self.logger.debug(f"Filtered DataFrame has {len(notebook_df)} rows with valid notebook paths")
-                
-                # Debug the notebook_df content
-                if len(notebook_df) > 0:
-                    self.logger.debug(f"Notebook DataFrame sample:\n{notebook_df.head()}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error creating DataFrame from workflow definition: {e}")
-                self.logger.debug(f"workflow_definition content: {workflow_definition}")
+                notebook_tasks = self._select_notebook_tasks(workflow_definition, job_id)
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.error(f"Error selecting notebook tasks from workflow definition: {e}")
                 return False, None
+            self.logger.debug(f"Found {len(notebook_tasks)} distinct tasks with valid notebook paths")
             
             # Prepare file mapping for notebooks (existing logic)
-            if len(notebook_df) > 0:
+            if notebook_tasks:
                 self.logger.debug("Preparing file mapping for notebooks...")
                 try:
-                    filtered_df = self._prepare_file_mapping(notebook_df, job_id, file_paths, start_path)
-                    self.logger.debug(f"_prepare_file_mapping returned DataFrame with shape: {filtered_df.shape}")
-                    if len(filtered_df) > 0:
-                        self.logger.debug(f"Prepared file mapping columns: {filtered_df.columns.tolist()}")
-                        self.logger.debug(f"Sample file mapping:\n{filtered_df.head()}")
+                    file_mapping = self._prepare_file_mapping(notebook_tasks, job_id, file_paths, start_path)
+                    self.logger.debug(f"_prepare_file_mapping returned {len(file_mapping)} entries")
                 except Exception as e:
                     self.logger.error(f"Error in _prepare_file_mapping: {e}")
                     return False, None
                 
                 # Move notebook files
                 self.logger.debug("Moving notebook files to destination directories...")
-                output, outcome = self.file_manager.move_files_to_directory(filtered_df, job_id, start_path)
+                output, outcome = self.file_manager.move_files_to_directory(file_mapping, job_id, start_path)
                 if outcome == 'failed':
                     self.logger.error(f"Failed to move notebook files for job id: {job_id}: {output}")
                     return False, None
                 
                 # Create notebook path mapping for YAML update
-                try:
-                    self.logger.debug("Creating notebook path mapping...")
-                    self.logger.debug(f"filtered_df columns: {filtered_df.columns.tolist()}")
-                    self.logger.debug(f"filtered_df shape: {filtered_df.shape}")
-                    
-                    # Debug the data types in the columns
-                    src_dirs = filtered_df['src_directory'].tolist()
-                    dest_dirs = filtered_df['dest_directory'].tolist()
-                    
-                    self.logger.debug(f"src_directory sample: {src_dirs[:3] if src_dirs else 'empty'}")
-                    self.logger.debug(f"dest_directory sample: {dest_dirs[:3] if dest_dirs else 'empty'}")
-                    
-                    # Check for any non-string values
-                    for i, (src, dest) in enumerate(zip(src_dirs, dest_dirs)):
-                        if not isinstance(src, str):
-                            self.logger.error(f"Non-string src_directory at index {i}: {src} (type: {type(src)})")
-                        if not isinstance(dest, str):
-                            self.logger.error(f"Non-string dest_directory at index {i}: {dest} (type: {type(dest)})")
-                    
-                    src_dest_mapping = dict(zip(filtered_df['src_directory'], filtered_df['dest_directory']))
-                    self.logger.debug(f"Successfully created notebook path mapping with {len(src_dest_mapping)} entries")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error creating notebook path mapping: {e}")
-                    self.logger.debug(f"filtered_df content:\n{filtered_df}")
-                    return False, None
+                src_dest_mapping = {entry['src_directory']: entry['dest_directory'] for entry in file_mapping}
+                self.logger.debug(f"Successfully created notebook path mapping with {len(src_dest_mapping)} entries")
             else:
                 self.logger.debug("No notebook files to move")
                 src_dest_mapping = {}
@@ -919,8 +920,6 @@ class DatabricksExporter:
             
             self.logger.debug(f"Final path mapping contains {len(src_dest_mapping)} entries")
             
-            job_resource_name = self.file_manager.convert_string(job_name)
-            
             # Get YAML file from discovered paths
             yml_files = [file for file in file_paths if file.endswith('.yml')]
             if not yml_files:
@@ -936,20 +935,18 @@ class DatabricksExporter:
                 return False, None
             
             # Ensure backup directory exists
-            if not os.path.exists(backup_yaml_path):
-                os.makedirs(backup_yaml_path)
-                self.logger.debug(f"Created backup directory: {backup_yaml_path}")
+            self._ensure_directory(backup_yaml_path)
 
             # Copy the file to yaml backup directory
             try:
-                shutil.copyfile(yml_file_abs, os.path.join(backup_yaml_path, os.path.basename(yml_file_abs)))
+                # A real copy, not a hardlink: the YAML is rewritten in place below and
+                # a link would carry those edits into the backup
                 shutil.copyfile(yml_file_abs, os.path.join(backup_yaml_path, os.path.basename(yml_file_abs)))
                 self.logger.debug(f"Copied YAML file to backup directory: {yml_file_abs}")
             except Exception as e:
                 self.logger.error(f"Failed to copy YAML file: {e}")
                 self.logger.debug(f"Source: {yml_file_abs}")
                 self.logger.debug(f"Destination: {os.path.join(backup_yaml_path, os.path.basename(yml_file_abs))}")
-                self.logger.debug(f"Destination: {os.path.join(backup_yaml_path, os.path.basename(yml_file_abs))}")
                 return False, None
             
             # Get replacements and update YAML
@@ -999,12 +996,18 @@ class DatabricksExporter:
             v_resource_key_job_id_mapping_csv_file_path: Path to save the CSV file
             list_resource_key_job_id_mapping: List of resource mappings
         """
+        import csv
+        
         # Write the mapping of resource key to job id to a csv file
         header = not os.path.exists(v_resource_key_job_id_mapping_csv_file_path)
-        if not os.path.exists(os.path.dirname(v_resource_key_job_id_mapping_csv_file_path)):
-            os.makedirs(os.path.dirname(v_resource_key_job_id_mapping_csv_file_path))
-        df_resource_key_job_id_mapping = pd.DataFrame(list_resource_key_job_id_mapping, columns=['job_key', 'job_id'])
-        df_resource_key_job_id_mapping.to_csv(v_resource_key_job_id_mapping_csv_file_path, index=False, mode='a', header=header)
+        csv_directory = os.path.dirname(v_resource_key_job_id_mapping_csv_file_path)
+        if csv_directory:
+            self._ensure_directory(csv_directory)
+        with open(v_resource_key_job_id_mapping_csv_file_path, 'a', newline='') as csv_file:
+            writer = csv.writer(csv_file, lineterminator=os.linesep)
+            if header:
+                writer.writerow(['job_key', 'job_id'])
+            writer.writerows(list_resource_key_job_id_mapping)
         self.logger.debug(f"Resource key to job ID mappings saved to {v_resource_key_job_id_mapping_csv_file_path}")
 
     def run_workflow_export(self) -> None:
@@ -1028,12 +1031,15 @@ class DatabricksExporter:
         successful_jobs = []
         resource_mappings = []
         
+        # Fetch job definitions up front; the API calls overlap while file work stays sequential
+        workflow_definitions = self._prefetch_workflow_definitions([job_id for job_id, _ in active_jobs])
+        
         # Process each job
         for job_id, job_status in active_jobs:
             try:
                 self.logger.debug(f"Starting to process job: {job_id} with status: {job_status}")
                 success, resource_mapping = self.process_job(
-                    job_id, start_path, backup_yaml_path, job_status)
+                    job_id, start_path, backup_yaml_path, job_status, workflow_definitions.get(job_id))
                 
                 if success:
                     successful_jobs.append(job_id)
@@ -1138,7 +1144,7 @@ class DatabricksExporter:
             # Generate YAML and source files using bundle generate
             self.logger.debug("Generating YAML and source files for pipeline...")
             databricks_yml_path = self.config_manager.get_databricks_yml_path()
-            output, outcome = self.cli_manager.generate_yaml_src_files_from_pipeline_id(pipeline_id, start_path, databricks_yml_path)
+            output, outcome = self.cli_manager.iter_yaml_src_files_from_pipeline_id(pipeline_id, start_path, databricks_yml_path)
             if outcome == 'failed':
                 self.logger.error(f"Error in generating YAML and source files for pipeline '{pipeline_name}' (ID: {pipeline_id}): {output}")
                 self._restore_backup_file(backup_file)  # Restore on failure
@@ -1484,9 +1490,7 @@ class DatabricksExporter:
                     path_mapping = src_dest_mapping
                 
                 # Ensure backup directory exists
-                if not os.path.exists(backup_yaml_path):
-                    os.makedirs(backup_yaml_path)
-                    self.logger.debug(f"Created backup directory: {backup_yaml_path}")
+                self._ensure_directory(backup_yaml_path)
 
                 # Copy the file to yaml backup directory (same as workflows)
                 try:
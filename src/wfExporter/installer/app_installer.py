@@ -12,6 +12,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 from databricks.sdk.service.workspace import ImportFormat
 from databricks.sdk.service.apps import AppDeployment
 
@@ -34,15 +35,18 @@ class ActiveDeploymentError(Exception):
 class AppInstaller:
     """Handles app installation to Databricks."""
     
-    def __init__(self, profile: Optional[str] = None):
+    def __init__(self, profile: Optional[str] = None, config: Optional[Config] = None,
+                 client: Optional[WorkspaceClient] = None):
         """
         Initialize the app installer.
         
         Args:
             profile: Databricks profile to use
+            config: Already loaded Databricks config to reuse instead of re-reading the profile
+            client: Already authenticated client to reuse instead of creating a new one
         """
         self.profile = profile
-        self.core = InstallerCore(profile=profile)
+        self.core = InstallerCore(profile=profile, config=config, client=client)
         self.client = self.core.client
         
         # App configuration
@@ -77,13 +81,13 @@ class AppInstaller:
         except ImportError:
             pass
         
-        # 2. Try using pkg_resources to find the installed wf_app package
+        # 2. Try using the distribution metadata to find the installed wf_app package
+        from importlib.metadata import distribution, PackageNotFoundError
         try:
-            import pkg_resources
-            dist = pkg_resources.get_distribution('wfexporter')
-            site_packages = Path(dist.location)
+            dist = distribution('wfexporter')
+            site_packages = Path(dist.locate_file(''))
             possible_paths.append(site_packages / "wf_app")
-        except (ImportError, pkg_resources.DistributionNotFound, FileNotFoundError):
+        except PackageNotFoundError:
             pass
         
         # 3. Try relative to this file's location (development structure)
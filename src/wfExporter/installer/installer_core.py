@@ -11,7 +11,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.core import DatabricksError
+from databricks.sdk.core import Config, DatabricksError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,24 +21,30 @@ logger = logging.getLogger(__name__)
 class InstallerCore:
     """Core installer functionality for WF Exporter components."""
     
-    def __init__(self, profile: Optional[str] = None):
+    def __init__(self, profile: Optional[str] = None, config: Optional[Config] = None,
+                 client: Optional[WorkspaceClient] = None):
         """
         Initialize the installer core.
         
         Args:
             profile: Databricks profile to use
+            config: Already loaded Databricks config to reuse instead of re-reading the profile
+            client: Already authenticated client to reuse instead of creating a new one
         """
         self.profile = profile
-        self.client = None
+        self.config = config
+        self.client = client
         self.current_user = None
         
-        if profile:
+        if client is None and (profile or config):
             self._initialize_client()
     
     def _initialize_client(self) -> None:
         """Initialize the Databricks client with the specified profile."""
         try:
-            if self.profile:
+            if self.config:
+                self.client = WorkspaceClient(config=self.config)
+            elif self.profile:
                 self.client = WorkspaceClient(profile=self.profile)
             else:
                 self.client = WorkspaceClient()
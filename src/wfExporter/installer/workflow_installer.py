@@ -11,6 +11,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 from databricks.sdk.service.jobs import JobSettings
 from databricks.sdk.service.workspace import ImportFormat
 
@@ -25,17 +26,20 @@ logger = logging.getLogger(__name__)
 class WorkflowInstaller:
     """Handles workflow installation to Databricks."""
     
-    def __init__(self, profile: Optional[str] = None, interactive: bool = True):
+    def __init__(self, profile: Optional[str] = None, interactive: bool = True, config: Optional[Config] = None,
+                 client: Optional[WorkspaceClient] = None):
         """
         Initialize the workflow installer.
         
         Args:
             profile: Databricks profile to use
             interactive: Whether to prompt for user input
+            config: Already loaded Databricks config to reuse instead of re-reading the profile
+            client: Already authenticated client to reuse instead of creating a new one
         """
         self.profile = profile
         self.interactive = interactive
-        self.core = InstallerCore(profile=profile)
+        self.core = InstallerCore(profile=profile, config=config, client=client)
         self.client = self.core.client
         
         # Workspace paths
@@ -519,13 +523,13 @@ class WorkflowInstaller:
         except ImportError:
             pass
         
-        # 2. Try using pkg_resources to find the installed wf_app package
+        # 2. Try using the distribution metadata to find the installed wf_app package
+        from importlib.metadata import distribution, PackageNotFoundError
         try:
-            import pkg_resources
-            dist = pkg_resources.get_distribution('wfexporter')
-            site_packages = Path(dist.location)
+            dist = distribution('wfexporter')
+            site_packages = Path(dist.locate_file(''))
             possible_paths.append(site_packages / "wf_app")
-        except (ImportError, pkg_resources.DistributionNotFound, FileNotFoundError):
+        except PackageNotFoundError:
             pass
         
         # 3. Try relative to this file's location (development structure)
@@ -0,0 +1,51 @@
+"""
+Lazy command group for the WF Exporter CLI.
+
+This module provides a Click group that imports each subcommand's module only
+when that subcommand is actually resolved.
+"""
+
+import importlib
+from typing import Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A Click group whose subcommands are imported on first use."""
+    
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Initialize the lazy group.
+        
+        Args:
+            lazy_subcommands: Mapping of command name to "module.path:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eagerly registered and lazy subcommands."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+        
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Resolve a subcommand, importing its module if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+        
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        """
+        Import and return a lazy subcommand.
+        
+        Args:
+            cmd_name: Name of the subcommand
+            
+        Returns:
+            The Click command object
+        """
+        module_name, attr = self.lazy_subcommands[cmd_name].split(':', 1)
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy loading of {module_name}:{attr} did not return a Click command")
+        return command
@@ -34,23 +34,9 @@ class LogManager:
         # Store config_data for later use
         self.config_data = config_data
         
-        # Load log level from override first, then config, then default
-        if override_log_level:
-            log_level_str = override_log_level
-        elif config_data:
-            log_level_str = config_data.get("initial_variables", {}).get("v_log_level", "INFO")
-        else:
-            log_level_str = "INFO"
-        
-        # Convert string log level to logging constant
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL
-        }
-        level = level_map.get(log_level_str.upper(), logging.INFO)
+        # A CLI override wins over any level found in configuration applied later
+        self._level_overridden = bool(override_log_level)
+        level = self._resolve_level(override_log_level, config_data)
         
         # Store the level for use in file handler
         self.log_level = level
@@ -73,6 +59,7 @@ class LogManager:
             handler.close()
         
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self._formatter = formatter
         
         # Console handler setup with colors
         console_handler = self._create_colored_console_handler(level, formatter)
@@ -85,6 +72,43 @@ class LogManager:
         # Store instance in class dictionary
         LogManager._instances[name] = self
     
+    @staticmethod
+    def _resolve_level(override_log_level: Optional[str], config_data: Optional[Dict[str, Any]]) -> int:
+        """Resolve the log level from the override first, then config, then default."""
+        if override_log_level:
+            log_level_str = override_log_level
+        elif config_data:
+            log_level_str = config_data.get("initial_variables", {}).get("v_log_level", "INFO")
+        else:
+            log_level_str = "INFO"
+        
+        # Convert string log level to logging constant
+        level_map = {
+            "DEBUG": logging.DEBUG,
+            "INFO": logging.INFO,
+            "WARNING": logging.WARNING,
+            "ERROR": logging.ERROR,
+            "CRITICAL": logging.CRITICAL
+        }
+        return level_map.get(log_level_str.upper(), logging.INFO)
+    
+    def apply_config(self, config_data: Dict[str, Any]) -> None:
+        """
+        Apply configuration to a logger created before the config was loaded.
+        
+        Adopts the configured log level (unless overridden) and adds the file handler.
+        
+        Args:
+            config_data: Configuration data containing log level and log directory
+        """
+        self.config_data = config_data
+        if not self._level_overridden:
+            self.log_level = self._resolve_level(None, config_data)
+            self.logger.setLevel(self.log_level)
+            for handler in self.logger.handlers:
+                handler.setLevel(self.log_level)
+        self._setup_file_handler(self._formatter)
+    
     def _create_colored_console_handler(self, level: int, formatter: logging.Formatter) -> logging.StreamHandler:
         """Create a console handler with colored output."""
         console_handler = logging.StreamHandler()
@@ -127,7 +151,7 @@ class LogManager:
             if hasattr(self, 'config_data') and self.config_data:
                 # Use ConfigManager to get the log directory path
                 from ..config.config_manager import ConfigManager
-                config_manager = ConfigManager(logger=None, config_path=None)
+                config_manager = ConfigManager.get()
                 log_dir = os.path.abspath(config_manager.get_log_directory_path())
             else:
                 # Fallback to default path
@@ -150,6 +174,10 @@ class LogManager:
         except Exception as e:
             print(f"Failed to set up file logging: {e}")
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str) -> None:
         """Log a debug message."""
         self.logger.debug(message)
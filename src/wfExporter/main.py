@@ -7,7 +7,6 @@ entry point, separate from the CLI interface.
 
 import logging
 from typing import Optional
-from .core.databricks_exporter import DatabricksExporter
 
 
 def main(config_path: Optional[str] = None, databricks_host: Optional[str] = None, 
@@ -27,6 +26,9 @@ def main(config_path: Optional[str] = None, databricks_host: Optional[str] = Non
         databricks_token: Databricks access token (for manual authentication)
         log_level: Override log level from CLI (optional)
     """
+    # Imported here so that importing the package stays lightweight
+    from .core.databricks_exporter import DatabricksExporter
+
     processor = DatabricksExporter(config_path, databricks_host, databricks_token, log_level)
     
     # Determine asset types based on configuration
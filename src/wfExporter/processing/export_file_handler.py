@@ -5,15 +5,26 @@ This module handles file operations such as moving, mapping, and transforming
 file paths for the workflow export process.
 """
 
+import functools
 import os
 import re
 import shutil
-from typing import Dict, List, Tuple, Optional
-
-import pandas as pd
+from typing import Any, Dict, List, Tuple, Optional
 
 from ..logging.log_manager import LogManager
 
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]|\s')
+_UNDERSCORES_RE = re.compile(r'_+')
+
+
+@functools.lru_cache(maxsize=256)
+def _convert_string(input_string: str) -> str:
+    """Memoized implementation of ExportFileHandler.convert_string."""
+    # Replace special chars and spaces with underscores, convert to lowercase
+    result = _SPECIAL_CHARS_RE.sub('_', input_string).lower()
+    # Clean up multiple underscores and remove leading/trailing ones
+    return _UNDERSCORES_RE.sub('_', result).strip('_')
+
 
 class ExportFileHandler:
     """
@@ -36,6 +47,8 @@ class ExportFileHandler:
         """
         self.logger = logger or LogManager()
         self.config_manager = config_manager
+        # Compiled path replacement patterns, built on first use
+        self._compiled_path_prefixes: Optional[List[Tuple[re.Pattern, str]]] = None
         
     def _get_path_prefixes(self) -> List[Tuple[str, str]]:
         """
@@ -61,6 +74,19 @@ class ExportFileHandler:
                 (r"^/", "../")
             ]
     
+    def _get_compiled_path_prefixes(self) -> List[Tuple[re.Pattern, str]]:
+        """
+        Get the path replacement patterns compiled once for reuse across paths.
+        
+        Returns:
+            List of (compiled pattern, replacement) tuples, applied in order
+        """
+        if self._compiled_path_prefixes is None:
+            self._compiled_path_prefixes = [
+                (re.compile(pattern), replacement) for pattern, replacement in self._get_path_prefixes()
+            ]
+        return self._compiled_path_prefixes
+    
     def convert_string(self, input_string: str) -> str:
         """
         Converts a string to a standardized format by replacing special characters and spaces 
@@ -72,10 +98,7 @@ class ExportFileHandler:
         Returns:
             The converted string in standardized format
         """
-        # Replace special chars and spaces with underscores, convert to lowercase
-        result = re.sub(r'[^\w\s]|\s', '_', input_string).lower()
-        # Clean up multiple underscores and remove leading/trailing ones
-        return re.sub(r'_+', '_', result).strip('_')
+        return _convert_string(input_string)
     
     def map_src_file_name(self, file_path: str, file_dict: Dict[str, str]) -> str:
         """
@@ -107,8 +130,8 @@ class ExportFileHandler:
             The transformed notebook path
         """
         # Replace path prefixes
-        for pattern, replacement in self._get_path_prefixes():
-            path = re.sub(pattern, replacement, path)
+        for pattern, replacement in self._get_compiled_path_prefixes():
+            path = pattern.sub(replacement, path)
         
         # Map the file name only if file_dict is provided and has a mapping
         if file_dict:
@@ -121,12 +144,12 @@ class ExportFileHandler:
         
         return path
     
-    def move_files_to_directory(self, df: pd.DataFrame, job_id: str, start_path: str) -> Tuple[str, str]:
+    def move_files_to_directory(self, file_mapping: List[Dict[str, Any]], job_id: str, start_path: str) -> Tuple[str, str]:
         """
-        Moves files from a source directory to a destination directory based on a DataFrame.
+        Moves files from a source directory to a destination directory based on a file mapping.
         
         Args:
-            df: DataFrame containing file mapping information with src_directory and dest_directory columns
+            file_mapping: File mapping entries with exported_file_path, dest_directory and Notebook_Path keys
             job_id: The job ID for logging purposes
             start_path: The base path for file operations
             
@@ -135,12 +158,12 @@ class ExportFileHandler:
         """
         try:
             files_not_moved = 0
-            total_files = len(df)
+            total_files = len(file_mapping)
             
             self.logger.debug(f"Moving {total_files} files for job {job_id}")
             
-            # Iterate over each row in the filtered DataFrame
-            for index, row in df.iterrows():
+            # Iterate over each entry in the file mapping
+            for index, row in enumerate(file_mapping):
                 # exported_file_path is the absolute path to the file after export
                 src_file_path = row['exported_file_path']
                 dest_file_path = (row['dest_directory']).replace('..', start_path)
@@ -5,14 +5,46 @@ This module handles YAML file manipulation including loading, updating,
 and dumping YAML files with custom formatting and transformations.
 """
 
+import logging
 import os
 import yaml
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from ..logging.log_manager import LogManager
 from ..workflow.workflow_extractor import WorkflowExtractor
 
 
+# Fields holding file paths, which value replacements must leave untouched
+_PATH_FIELDS = frozenset({'notebook_path', 'python_file', 'path', 'file'})
+
+
+def _compile_replacements(replacements: Dict[str, str]) -> Optional[Callable[[str], str]]:
+    """
+    Build a function that applies all literal value replacements to a string.
+    
+    Replacements run one after another in mapping order, so the output of one
+    rule can be rewritten by a later rule (e.g. a later '${' -> '$${' escape).
+    
+    Args:
+        replacements: Mapping of literal substrings to their replacements; keys that
+            look like regex groups (starting with '(') are skipped
+            
+    Returns:
+        A str -> str replacement function, or None if there is nothing to replace
+    """
+    literals = tuple((pattern, replacement) for pattern, replacement in replacements.items()
+                     if not pattern.startswith(r'('))
+    if not literals:
+        return None
+    
+    def replace(text: str) -> str:
+        for pattern, replacement in literals:
+            if pattern in text:
+                text = text.replace(pattern, replacement)
+        return text
+    return replace
+
+
 class YamlSerializer:
     """
     A class for processing and manipulating YAML files.
@@ -71,31 +103,39 @@ class YamlSerializer:
         Returns:
             The processed data structure with replacements made
         """
-        # Define path fields that should be excluded from replacements
-        PATH_FIELDS = {
-            'notebook_path',  # notebook task paths
-            'python_file',    # spark python task paths  
-            'path',          # general path field (sql task file path, library paths, etc.)
-            'file'           # file references
-        }
+        return self.replace_values(data, lambda text: text.replace(old_value, new_value), current_key)
+
+    def replace_values(self, data: Any, replace_fn: Callable[[str], str], current_key: str = None) -> Any:
+        """
+        Recursively applies replace_fn to every string in a nested dictionary or list.
+        Excludes file path fields from replacement to preserve downloaded file paths.
         
+        Args:
+            data: The data structure to process
+            replace_fn: Function returning the replaced form of a string
+            current_key: The current key being processed (for path exclusion)
+            
+        Returns:
+            The processed data structure with replacements made
+        """
         if isinstance(data, dict):
             result = {}
             for key, value in data.items():
                 # Skip replacement for path-related fields
-                if key in PATH_FIELDS:
+                if key in _PATH_FIELDS:
                     result[key] = value  # Keep original path value without replacement
-                    self.logger.debug(f"Skipping replacement for path field: {key} = {value}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Skipping replacement for path field: {key} = {value}")
                 else:
-                    result[key] = self.replace_keyword_in_values(value, old_value, new_value, key)
+                    result[key] = self.replace_values(value, replace_fn, key)
             return result
         elif isinstance(data, list):
-            return [self.replace_keyword_in_values(item, old_value, new_value, current_key) for item in data]
+            return [self.replace_values(item, replace_fn, current_key) for item in data]
         elif isinstance(data, str):
             # Only replace if we're not in a path field context
-            if current_key in {'notebook_path', 'python_file', 'path', 'file'}:
+            if current_key in _PATH_FIELDS:
                 return data  # Keep original path
-            return data.replace(old_value, new_value)
+            return replace_fn(data)
         else:
             return data
 
@@ -162,10 +202,10 @@ class YamlSerializer:
             self.logger.debug("Permissions added successfully")
 
             self.logger.debug("Replacing keyword variables in yaml file")
-            # Apply string replacements to the entire YAML data
-            for pattern, replacement in replacements.items():
-                if not pattern.startswith(r'('):  # Skip regex patterns
-                    yaml_data = self.replace_keyword_in_values(yaml_data, pattern, replacement)
+            # Apply string replacements to the entire YAML data in one walk
+            replace_fn = _compile_replacements(replacements)
+            if replace_fn is not None:
+                yaml_data = self.replace_values(yaml_data, replace_fn)
             self.logger.debug("Keyword variables replaced successfully")
             
             self.logger.debug("Replacing null with none in yaml file")
@@ -348,9 +388,9 @@ class YamlSerializer:
             if replacements:
                 self.logger.debug("Replacing keyword variables in yaml file")
                 # Apply string replacements to the entire YAML data (same as job processing)
-                for pattern, replacement in replacements.items():
-                    if not pattern.startswith(r'('):  # Skip regex patterns
-                        yaml_data = self.replace_keyword_in_values(yaml_data, pattern, replacement)
+                replace_fn = _compile_replacements(replacements)
+                if replace_fn is not None:
+                    yaml_data = self.replace_values(yaml_data, replace_fn)
                 self.logger.debug("Keyword variables replaced successfully")
             
             # Replace null with none